@@ -67,7 +67,11 @@ from verticapy.core.parsers.all import read_file
 from verticapy.core.parsers.avro import read_avro
 from verticapy.core.parsers.csv import read_csv, pcsv
 from verticapy.core.parsers.json import read_json, pjson
-from verticapy.core.parsers.pandas import read_pandas, read_pandas as pandas_to_vertica
+from verticapy.core.parsers.pandas import (
+    read_csv_arrow,
+    read_pandas,
+    read_pandas as pandas_to_vertica,
+)
 from verticapy.core.parsers.shp import read_shp
 from verticapy.core.string_sql.base import StringSQL
 from verticapy.core.tablesample.base import TableSample
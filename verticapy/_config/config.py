@@ -280,6 +280,14 @@ def set_option(key: str, value: Any = None) -> None:
             :py:class:`vDataFrame` and :py:class:`verticapy.core.tablesample.base.TableSample`
             is computed and displayed in the footer (if
             ``footer_on is True``).
+         - fast_unique:
+            [bool]
+            If set to ``True``, the ``unique`` analytic
+            function is computed using a single
+            ``COUNT(DISTINCT ...)`` window aggregate
+            instead of two ``DENSE_RANK``. This avoids
+            sorting each partition twice, but ``NULL``
+            values are not counted as a distinct value.
          - footer_on:
             [bool]
             If set to ``True``, :py:class:`vDataFrame` and
@@ -683,6 +691,7 @@ def set_option(key: str, value: Any = None) -> None:
 register_option(Option("cache", True, "", bool_validator))
 register_option(Option("interactive", False, "", bool_validator))
 register_option(Option("count_on", False, "", bool_validator))
+register_option(Option("fast_unique", False, "", bool_validator))
 register_option(Option("footer_on", True, "", bool_validator))
 register_option(Option("label_separator", None, "", optional_str_validator))
 register_option(Option("label_suffix", None, "", optional_str_validator))
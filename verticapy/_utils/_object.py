@@ -18,13 +18,30 @@ This file was created to avoid circular import and to
 locate all  the  inner functions imports in only  one
 single file.  No other file should have inner imports.
 """
-from typing import Literal, TYPE_CHECKING
+import importlib
+from functools import lru_cache
+from typing import Any, Literal, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from verticapy.core.vdataframe.base import vDataColumn, vDataFrame
     import verticapy.machine_learning.vertica as vml
 
 
+@lru_cache(maxsize=None)
+def _get_object(module: str, name: Optional[str] = None) -> Any:
+    """
+    Imports the input module and returns
+    it, or its attribute ``name`` if it
+    is specified. The result is cached,
+    so the import machinery is only used
+    on the first call.
+    """
+    module_obj = importlib.import_module(module)
+    if name:
+        return getattr(module_obj, name)
+    return module_obj
+
+
 def create_new_vdc(*args, **kwargs) -> "vDataColumn":
     """
     Creates a :py:class:`vDataColumn`.
@@ -37,8 +54,7 @@ def create_new_vdc(*args, **kwargs) -> "vDataColumn":
         the function. For more information about the object,
         please refer to the link above.
     """
-    from verticapy.core.vdataframe.base import vDataColumn
-
+    vDataColumn = _get_object("verticapy.core.vdataframe.base", "vDataColumn")
     return vDataColumn(*args, **kwargs)
 
 
@@ -54,8 +70,7 @@ def create_new_vdf(*args, **kwargs) -> "vDataFrame":
         the function. For more information about the object,
         please refer to the link above.
     """
-    from verticapy.core.vdataframe.base import vDataFrame
-
+    vDataFrame = _get_object("verticapy.core.vdataframe.base", "vDataFrame")
     return vDataFrame(*args, **kwargs)
 
 
@@ -72,9 +87,7 @@ def get_vertica_mllib() -> Literal["vml"]:
         the function. For more information about the object,
         please refer to the link above.
     """
-    import verticapy.machine_learning.vertica as vml
-
-    return vml
+    return _get_object("verticapy.machine_learning.vertica")
 
 
 def read_pd(*args, **kwargs) -> "vDataFrame":
@@ -92,6 +105,5 @@ def read_pd(*args, **kwargs) -> "vDataFrame":
         the function. For more information about the object,
         please refer to the link above.
     """
-    from verticapy.core.parsers.pandas import read_pandas
-
+    read_pandas = _get_object("verticapy.core.parsers.pandas", "read_pandas")
     return read_pandas(*args, **kwargs)
@@ -14,12 +14,19 @@ OR CONDITIONS OF ANY KIND, either express or implied.
 See the  License for the specific  language governing
 permissions and limitations under the License.
 """
+import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional
 
-from verticapy._utils._sql._format import list_strip
+import numpy as np
 
+_HEADER_STRIP = str.maketrans("", "", '\n"\r')
+_HEADER_BLOCK_SIZE = 65536
 
-def get_header_names(path: str, sep: str) -> list[str]:
+
+def get_header_names(path: str, sep: str, cache: bool = False) -> list[str]:
     """
     Returns the input CSV file's
     header columns' names.
@@ -30,6 +37,11 @@ def get_header_names(path: str, sep: str) -> list[str]:
         File's path.
     sep: str
         CSV separator.
+    cache: bool, optional
+        If set to ``True``, the header
+        is cached and reused as long as
+        the file's modification time,
+        size and inode are unchanged.
 
     Returns
     -------
@@ -66,33 +78,202 @@ def get_header_names(path: str, sep: str) -> list[str]:
         construct others, simplifying the overall
         code.
     """
-    with open(path, "r", encoding="utf-8") as f:
-        file_header = f.readline().replace("\n", "").replace('"', "")
-        if not sep:
-            sep = guess_sep(file_header)
-        file_header = file_header.split(sep)
-    for idx, col in enumerate(file_header):
-        if col == "":
-            if idx == 0:
-                position = "beginning"
-            elif idx == len(file_header) - 1:
-                position = "end"
-            else:
-                position = "middle"
-            file_header[idx] = f"col{idx}"
-            warning_message = (
-                f"An inconsistent name was found in the {position} of the "
-                "file header (isolated separator). It will be replaced "
-                f"by col{idx}."
-            )
-            if idx == 0:
-                warning_message += (
-                    "\nThis can happen when exporting a pandas DataFrame "
-                    "to CSV while retaining its indexes.\nTip: Use "
-                    "index=False when exporting with pandas.DataFrame.to_csv."
-                )
-            warnings.warn(warning_message, Warning)
-    return list_strip(file_header)
+    if cache:
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        file_header = list(
+            _split_header_cached(path, stat.st_mtime_ns, stat.st_size, stat.st_ino, sep)
+        )
+    else:
+        file_header = _split_header(path, sep)
+    if "" not in file_header:
+        return [col.strip() for col in file_header]
+    n = len(file_header)
+    empty_idx = [idx for idx, col in enumerate(file_header) if col == ""]
+    positions = []
+    for idx in empty_idx:
+        if idx == 0:
+            position = "beginning"
+        elif idx == n - 1:
+            position = "end"
+        else:
+            position = "middle"
+        file_header[idx] = f"col{idx}"
+        positions += [f"{position} (replaced by col{idx})"]
+    warning_message = (
+        "Inconsistent names were found in the file header (isolated "
+        f"separators), at the following positions: {', '.join(positions)}."
+    )
+    if empty_idx[0] == 0:
+        warning_message += (
+            "\nThis can happen when exporting a pandas DataFrame "
+            "to CSV while retaining its indexes.\nTip: Use "
+            "index=False when exporting with pandas.DataFrame.to_csv."
+        )
+    warnings.warn(warning_message, Warning)
+    return [col.strip() for col in file_header]
+
+
+@lru_cache(maxsize=256)
+def _split_header_cached(
+    path: str, mtime: int, size: int, inode: int, sep: str
+) -> tuple[str]:
+    """
+    Cached version of ``_split_header``.
+    The file's modification time, size
+    and inode are part of the key, so
+    that any change in the file, or its
+    replacement, invalidates its entry.
+    """
+    return tuple(_split_header(path, sep))
+
+
+def _split_header(path: str, sep: str) -> list[str]:
+    """
+    Reads the input CSV file's header
+    and splits it on the separator. It
+    is guessed when empty. The empty
+    names are kept as they are.
+    """
+    file_header = read_first_line(path).translate(_HEADER_STRIP)
+    if not sep:
+        sep = guess_sep(file_header)
+    return file_header.split(sep)
+
+
+def get_header_names_many(
+    paths: list[str], sep: Optional[str] = None, max_workers: int = 8
+) -> dict[str, list[str]]:
+    """
+    Returns the header columns' names
+    of several CSV files. The headers
+    are read in parallel using a pool
+    of threads.
+
+    Parameters
+    ----------
+    paths: list
+        Files' paths.
+    sep: str, optional
+        CSV separator. If empty, it is
+        guessed for each file.
+    max_workers: int, optional
+        Maximum number of threads used
+        to read the headers.
+
+    Returns
+    -------
+    dict
+        dictionary mapping each path to
+        its header columns' names.
+
+    Examples
+    --------
+    The following code demonstrates
+    the usage of the function.
+
+    .. ipython:: python
+
+        # Import the function.
+        from verticapy._utils._parsers import get_header_names_many
+
+        # Creating two CSV examples.
+        file_names = ['verticapy_test_parsers1.csv', 'verticapy_test_parsers2.csv']
+        for file_name in file_names:
+            f = open(file_name, 'a')
+            f.write("A;B;C;D")
+            f.close()
+
+        # Example.
+        get_header_names_many(file_names, sep = ';')
+
+        # Deleting the CSV files.
+        import os
+
+        for file_name in file_names:
+            os.remove(file_name)
+
+    .. note::
+
+        These functions serve as utilities to
+        construct others, simplifying the overall
+        code.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        headers = executor.map(lambda path: get_header_names(path, sep), paths)
+        return dict(zip(paths, headers))
+
+
+def read_first_line(path: str) -> str:
+    """
+    Returns the first line of the
+    input file. The file is read by
+    fixed-size blocks until the end
+    of the first line, so that only
+    the header bytes are decoded.
+
+    Parameters
+    ----------
+    path: str
+        File's path.
+
+    Returns
+    -------
+    str
+        first line, without its
+        line break.
+
+    Examples
+    --------
+    The following code demonstrates
+    the usage of the function.
+
+    .. ipython:: python
+
+        # Import the function.
+        from verticapy._utils._parsers import read_first_line
+
+        # Creating a CSV example.
+        file_name = 'verticapy_test_parsers.csv'
+        f = open(file_name, 'a')
+        f.write("A;B;C;D\n1;2;3;4")
+        f.close()
+
+        # Example.
+        read_first_line(file_name)
+
+        # Deleting the CSV file.
+        import os
+
+        os.remove(file_name)
+
+    .. note::
+
+        These functions serve as utilities to
+        construct others, simplifying the overall
+        code.
+    """
+    buffer, end = bytearray(), -1
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        while end < 0:
+            block = os.read(fd, _HEADER_BLOCK_SIZE)
+            if not block:
+                break
+            start = len(buffer)
+            buffer += block
+            ends = [
+                idx
+                for idx in (buffer.find(b"\n", start), buffer.find(b"\r", start))
+                if idx >= 0
+            ]
+            if ends:
+                end = min(ends)
+    finally:
+        os.close(fd)
+    if end >= 0:
+        buffer = buffer[:end]
+    return buffer.decode("utf-8")
 
 
 def guess_sep(file_str: str) -> str:
@@ -131,11 +312,12 @@ def guess_sep(file_str: str) -> str:
         construct others, simplifying the overall
         code.
     """
-    sep = ","
-    max_occur = file_str.count(",")
-    for s in ("|", ";"):
-        total_occurences = file_str.count(s)
-        if total_occurences > max_occur:
-            max_occur = total_occurences
-            sep = s
-    return sep
+    counts = np.bincount(
+        np.frombuffer(file_str.encode("utf-8"), dtype=np.uint8), minlength=256
+    )
+    # The priority breaks ties in favor of ',' then '|'.
+    return max(
+        (counts[ord(",")], 0, ","),
+        (counts[ord("|")], -1, "|"),
+        (counts[ord(";")], -2, ";"),
+    )[2]
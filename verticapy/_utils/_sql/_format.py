@@ -16,6 +16,7 @@ permissions and limitations under the License.
 """
 import re
 import warnings
+from functools import lru_cache
 from typing import Any, Iterable, Literal, Optional
 
 import numpy as np
@@ -482,6 +483,30 @@ COL_TAG_R = "</b>"
 COMMENT_TAG_L = '<b style="color: #9DA3AF; font-weight: normal;">'
 COMMENT_TAG_R = "</b>"
 
+"""
+Regular Expressions
+"""
+
+_COL_RE = re.compile(r"(\"(.)+\")")
+_STRING_RE = re.compile(r"(\'(.)+\')")
+_COMMENT_RE = re.compile(r"(--.+(\n|\Z))")
+_BLOCK_COMMENT_RE = re.compile(r"(/\*(.+?)\*/)")
+_DIGIT_RE = re.compile(r"(\s|\+|\-|\\|\*|\/)(\d+)(\s|\+|\-|\\|\*|\/|$)")
+_LINE_COMMENT_RE = re.compile(r"--.+(\n|\Z)")
+_INLINE_COMMENT_RE = re.compile(r"/\*(.+?)\*/")
+_SPACES_RE = re.compile(" +")
+_LABEL_RE = re.compile(r"\/\*\+LABEL(.*?)\*\/")
+_QUOTED_LABEL_RE = re.compile(r"\/\*\+LABEL\(\'(.*?)\'\)\*\/")
+_VARIABLE_RE = re.compile(r"(?<!:):[A-Za-z0-9_\[\]]+")
+
+
+@lru_cache(maxsize=None)
+def _keyword_pattern(w: str) -> re.Pattern:
+    # The keyword dictionaries hold thousands of
+    # patterns, far more than the 're' module cache.
+    return re.compile(re.escape(w), flags=re.IGNORECASE)
+
+
 """
 Main function
 """
@@ -573,14 +598,10 @@ def _format_keys(
         for l in d[key]["l"]:
             for r in d[key]["r"]:
                 w = l + key + r
-                sql = re.sub(re.escape(w), w.upper(), sql, flags=re.IGNORECASE)
+                pattern = _keyword_pattern(w)
+                sql = pattern.sub(w.upper(), sql)
                 if not (isinstance(mkd, NoneType)):
-                    mkd = re.sub(
-                        re.escape(w),
-                        l + tag_l + key.upper() + tag_r + r,
-                        mkd,
-                        flags=re.IGNORECASE,
-                    )
+                    mkd = pattern.sub(l + tag_l + key.upper() + tag_r + r, mkd)
     return sql, mkd
 
 
@@ -645,21 +666,11 @@ def format_query(
         html_res = None
     # STRINGS
     if display_success:
-        html_res = re.sub(
-            r"(\"(.)+\")",
-            COL_TAG_L + r" \1 " + COL_TAG_R,
-            html_res,
-        )
-        html_res = re.sub(
-            r"(\'(.)+\')",
-            STRING_TAG_L + r" \1 " + STRING_TAG_R,
-            html_res,
-        )
-        html_res = re.sub(
-            r"(--.+(\n|\Z))", COMMENT_TAG_L + r" \1 " + COMMENT_TAG_R, html_res
-        )
-        html_res = re.sub(
-            r"(/\*(.+?)\*/)", COMMENT_TAG_L + r" \1 " + COMMENT_TAG_R, html_res
+        html_res = _COL_RE.sub(COL_TAG_L + r" \1 " + COL_TAG_R, html_res)
+        html_res = _STRING_RE.sub(STRING_TAG_L + r" \1 " + STRING_TAG_R, html_res)
+        html_res = _COMMENT_RE.sub(COMMENT_TAG_L + r" \1 " + COMMENT_TAG_R, html_res)
+        html_res = _BLOCK_COMMENT_RE.sub(
+            COMMENT_TAG_L + r" \1 " + COMMENT_TAG_R, html_res
         )
     # SQL KEY WORDS
     res, html_res = _format_keys(
@@ -683,10 +694,8 @@ def format_query(
     )
     # DIGITS
     if display_success:
-        html_res = re.sub(
-            r"(\s|\+|\-|\\|\*|\/)(\d+)(\s|\+|\-|\\|\*|\/|$)",
-            r"\1" + DIGIT_TAG_L + r" \2 " + DIGIT_TAG_R + r"\3",
-            html_res,
+        html_res = _DIGIT_RE.sub(
+            r"\1" + DIGIT_TAG_L + r" \2 " + DIGIT_TAG_R + r"\3", html_res
         )
 
     if indent_sql:
@@ -756,9 +765,9 @@ def clean_query(query: SQLExpression) -> SQLExpression:
     if isinstance(query, list):
         return [clean_query(q) for q in query]
     else:
-        query = re.sub(r"--.+(\n|\Z)", "", query)
+        query = _LINE_COMMENT_RE.sub("", query)
         query = query.replace("\t", " ").replace("\n", " ")
-        query = re.sub(" +", " ", query)
+        query = _SPACES_RE.sub(" ", query)
 
         while len(query) > 0 and query.endswith((";", " ")):
             query = query[0:-1]
@@ -808,8 +817,8 @@ def erase_comment(query: SQLExpression) -> SQLExpression:
         construct others, simplifying the overall
         code.
     """
-    query = re.sub(r"--.+(\n|\Z)", "", query)
-    query = re.sub(r"/\*(.+?)\*/", "", query)
+    query = _LINE_COMMENT_RE.sub("", query)
+    query = _INLINE_COMMENT_RE.sub("", query)
     return query.strip()
 
 
@@ -852,7 +861,7 @@ def erase_label(query: SQLExpression) -> SQLExpression:
         construct others, simplifying the overall
         code.
     """
-    labels = re.findall(r"\/\*\+LABEL(.*?)\*\/", query)
+    labels = _LABEL_RE.findall(query)
     for label in labels:
         query = query.replace(f"/*+LABEL{label}*/", "")
     return query.strip()
@@ -1463,7 +1472,7 @@ def replace_label(
         separator = ""
     if isinstance(suffix, NoneType):
         suffix = ""
-    labels = re.findall(r"\/\*\+LABEL\(\'(.*?)\'\)\*\/", query)
+    labels = _QUOTED_LABEL_RE.findall(query)
     for label in labels:
         if isinstance(new_label, NoneType):
             nlabel = label
@@ -1545,7 +1554,7 @@ def replace_vars_in_query(query: SQLExpression, locals_dict: dict) -> SQLExpress
         construct others, simplifying the overall
         code.
     """
-    variables, query_tmp = re.findall(r"(?<!:):[A-Za-z0-9_\[\]]+", query), query
+    variables, query_tmp = _VARIABLE_RE.findall(query), query
     for v in variables:
         fail = True
         if len(v) > 1 and not v[1].isdigit():
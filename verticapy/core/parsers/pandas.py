@@ -23,6 +23,7 @@ import pandas as pd
 import verticapy._config.config as conf
 from verticapy._typing import NoneType
 from verticapy._utils._gen import gen_tmp_name
+from verticapy._utils._parsers import guess_sep, read_first_line
 from verticapy._utils._sql._collect import save_verticapy_logs
 from verticapy._utils._sql._format import format_schema_table, format_type, quote_ident
 from verticapy._utils._sql._sys import _executeSQL
@@ -31,6 +32,9 @@ from verticapy._utils._sql._sys import _executeSQL
 from verticapy.core.parsers.csv import read_csv
 from verticapy.core.vdataframe.base import vDataFrame
 
+if conf.get_import_success("pyarrow"):
+    from pyarrow import csv as pacsv
+
 
 @save_verticapy_logs
 def read_pandas(
@@ -409,3 +413,72 @@ def read_pandas(
         if clear:
             del tmp_df
     return vdf
+
+
+@save_verticapy_logs
+def read_csv_arrow(path: str, sep: Optional[str] = None, **kwargs) -> vDataFrame:
+    """
+    Ingests a CSV file into the
+    Vertica database. The file is
+    parsed by the ``pyarrow`` CSV
+    reader and the result is then
+    ingested using the
+    :py:func:`verticapy.read_pandas`
+    function, avoiding the slower
+    ``pandas`` CSV parser.
+
+    Parameters
+    ----------
+    path: str
+        File's path.
+    sep: str, optional
+        CSV separator. If empty, it
+        is guessed from the file
+        header.
+    **kwargs
+        Any optional parameter to pass
+        to :py:func:`verticapy.read_pandas`.
+
+    Returns
+    -------
+    vDataFrame
+        :py:class:`vDataFrame`
+        of the new relation.
+
+    Examples
+    --------
+    The following code demonstrates
+    the usage of the function.
+
+    .. code-block:: python
+
+        from verticapy import read_csv_arrow
+
+        # The separator is guessed from the header.
+        vdf = read_csv_arrow("titanic.csv")
+
+    .. note::
+
+        This function requires the ``pyarrow``
+        module.
+
+    .. seealso::
+
+        | :py:func:`verticapy.read_csv` :
+            Ingests a CSV file into the Vertica DB.
+        | :py:func:`verticapy.read_pandas` :
+            Ingests the ``pandas.DataFrame`` into the Vertica DB.
+    """
+    if not conf.get_import_success("pyarrow"):
+        raise ImportError(
+            "The pyarrow module doesn't seem to be "
+            "installed in your environment.\nTo be "
+            "able to use this function, you'll have to "
+            "install it.\n[Tips] Run: 'pip3 install "
+            "pyarrow' in your terminal to install "
+            "the module."
+        )
+    if not sep:
+        sep = guess_sep(read_first_line(path))
+    table = pacsv.read_csv(path, parse_options=pacsv.ParseOptions(delimiter=sep))
+    return read_pandas(table.to_pandas(), **kwargs)
@@ -14,14 +14,30 @@ OR CONDITIONS OF ANY KIND, either express or implied.
 See the  License for the specific  language governing
 permissions and limitations under the License.
 """
-from typing import Optional
+import io
+import itertools
+import os
+from typing import Optional, TYPE_CHECKING
 
 import verticapy._config.config as conf
+from verticapy._utils._object import create_new_vdf
 from verticapy._utils._sql._collect import save_verticapy_logs
+from verticapy._utils._sql._format import format_schema_table
 from verticapy._utils._sql._sys import _executeSQL
 from verticapy.errors import ExtensionError
 
-from verticapy.core.vdataframe.base import vDataFrame
+if TYPE_CHECKING:
+    from verticapy.core.vdataframe.base import vDataFrame
+
+_SHP_DEF_SQL = (
+    "SELECT /*+LABEL('read_shp')*/ "
+    "STV_ShpCreateTable(USING PARAMETERS file='{path}') "
+    "OVER() AS create_shp_table;"
+)
+_SHP_COPY_SQL = (
+    "COPY {relation} WITH SOURCE STV_ShpSource(file='{path}') "
+    "PARSER STV_ShpParser();"
+)
 
 
 @save_verticapy_logs
@@ -29,7 +45,7 @@ def read_shp(
     path: str,
     schema: Optional[str] = None,
     table_name: Optional[str] = None,
-) -> vDataFrame:
+) -> "vDataFrame":
     """
     Ingests a SHP file. At the
     moment, only files located
@@ -96,34 +112,30 @@ def read_shp(
         | :py:func:`verticapy.sql.geo.rename_index` :
             Renames the geo index.
     """
-    if not (schema):
-        schema = conf.get_option("temp_schema")
-    file = path.split("/")[-1]
-    file_extension = file[-3 : len(file)]
-    if file_extension != "shp":
+    file = os.path.basename(path)
+    file_root, file_extension = os.path.splitext(file)
+    if file_extension.lower() != ".shp":
         raise ExtensionError("The file extension is incorrect !")
+    get_option = conf.get_option
+    if not (schema):
+        schema = get_option("temp_schema")
+    path_str = path.replace("'", "''")
     result = _executeSQL(
-        query=f"""
-            SELECT 
-                /*+LABEL('read_shp')*/ 
-                STV_ShpCreateTable(USING PARAMETERS file='{path}')
-                OVER() AS create_shp_table;""",
+        query=_SHP_DEF_SQL.format_map({"path": path_str}),
         title="Getting SHP definition.",
         method="fetchall",
     )
-    if not table_name:
-        table_name = file[:-4]
-    result[0] = [f'CREATE TABLE "{schema}"."{table_name}"(']
-    result = [elem[0] for elem in result]
-    result = "".join(result)
-    _executeSQL(result, title="Creating the relation.")
+    table_name = table_name or file_root
+    relation = format_schema_table(schema, table_name)
+    query = io.StringIO()
+    query.write(f"CREATE TABLE {relation}(")
+    for (fragment,) in itertools.islice(result, 1, None):
+        query.write(fragment)
+    _executeSQL(query.getvalue(), title="Creating the relation.")
     _executeSQL(
-        query=f"""
-            COPY "{schema}"."{table_name}" 
-            WITH SOURCE STV_ShpSource(file=\'{path}\')
-            PARSER STV_ShpParser();""",
+        query=_SHP_COPY_SQL.format_map({"relation": relation, "path": path_str}),
         title="Ingesting the data.",
     )
-    if conf.get_option("print_info"):
-        print(f'The table "{schema}"."{table_name}" has been successfully created.')
-    return vDataFrame(table_name, schema=schema)
+    if get_option("print_info"):
+        print(f"The table {relation} has been successfully created.")
+    return create_new_vdf(table_name, schema=schema)
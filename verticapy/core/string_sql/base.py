@@ -127,6 +127,9 @@ class StringSQL:
         # Extension
         num1._between(num2, num3)
 
+        # Method Chaining
+        num1.sub(num2).mul(2).round(3)
+
     .. note::
 
         Most mathematical operators can be applied
@@ -535,5 +538,24 @@ class StringSQL:
     def __round__(self, x) -> "StringSQL":
         return StringSQL(f"ROUND({self._init_transf}, {x})", self.category())
 
+    # Same methods as the vDataColumn arithmetic. They keep
+    # building a single expression, which is only evaluated
+    # once assigned to a vDataFrame.
+
+    def add(self, x: Any) -> "StringSQL":
+        return self.__add__(x)
+
+    def div(self, x: Any) -> "StringSQL":
+        return self.__truediv__(x)
+
+    def mul(self, x: Any) -> "StringSQL":
+        return self.__mul__(x)
+
+    def round(self, n: int) -> "StringSQL":
+        return self.__round__(n)
+
+    def sub(self, x: Any) -> "StringSQL":
+        return self.__sub__(x)
+
     def category(self) -> str:
         return self._category
@@ -858,7 +858,7 @@ class vDFFilter(vDFAgg):
                 expr=f"""ROW_NUMBER() OVER (PARTITION BY {", ".join(columns)})""",
             )
             self.filter(f'"{name}" = 1')
-            self._vars["exclude_columns"] += [f'"{name}"']
+            self._vars["exclude_columns"].add(f'"{name}"')
         elif conf.get_option("print_info"):
             print("No duplicates detected.")
         return self
@@ -1784,7 +1784,7 @@ class vDFFilter(vDFAgg):
             conf.set_option("print_info", False)
             vdf.filter(f"{name} <= {q}")
             conf.set_option("print_info", print_info_init)
-            vdf._vars["exclude_columns"] += [name]
+            vdf._vars["exclude_columns"].add(name)
         elif method in ("stratified", "systematic"):
             assert method != "stratified" or (by), ValueError(
                 "Parameter 'by' must include at least one "
@@ -1802,7 +1802,7 @@ class vDFFilter(vDFAgg):
             conf.set_option("print_info", False)
             vdf.filter(f"{name} = {name2}")
             conf.set_option("print_info", print_info_init)
-            vdf._vars["exclude_columns"] += [name, name2]
+            vdf._vars["exclude_columns"].update((name, name2))
         return vdf
 
     @save_verticapy_logs
@@ -2072,7 +2072,7 @@ class vDCFilter(vDCAgg):
             self._parent._vars["columns"].remove(self._alias)
             delattr(self._parent, self._alias)
         except QueryError:
-            self._parent._vars["exclude_columns"] += [self._alias]
+            self._parent._vars["exclude_columns"].add(self._alias)
         if add_history:
             self._parent._add_to_history(
                 f"[Drop]: vDataColumn {self} was deleted from the vDataFrame."
@@ -15,10 +15,13 @@ See the  License for the specific  language governing
 permissions and limitations under the License.
 """
 import copy
-import random
+import math
+import numbers
 import re
 from typing import Literal, Optional, Union, TYPE_CHECKING
 
+from vertica_python.errors import QueryError
+
 import verticapy._config.config as conf
 from verticapy._typing import PythonNumber, PythonScalar, SQLColumns
 from verticapy._utils._gen import gen_name
@@ -27,7 +30,7 @@ from verticapy._utils._object import create_new_vdf
 from verticapy._utils._sql._cast import to_category
 from verticapy._utils._sql._collect import save_verticapy_logs
 from verticapy._utils._sql._format import format_type, quote_ident
-from verticapy.errors import MissingColumn, QueryError
+from verticapy.errors import MissingColumn, QueryError as vQueryError
 
 from verticapy.core.string_sql.base import StringSQL
 
@@ -38,6 +41,234 @@ from verticapy.sql.dtypes import get_data_types
 if TYPE_CHECKING:
     from verticapy.core.vdataframe.base import vDataFrame, vDataColumn
 
+# Functions managed by the 'analytic' method.
+_ANALYTIC_AGG_FUNCS = frozenset(
+    (
+        "max",
+        "min",
+        "avg",
+        "sum",
+        "count",
+        "stddev",
+        "median",
+        "variance",
+        "unique",
+        "top",
+        "kurtosis",
+        "skewness",
+        "mad",
+        "aad",
+        "range",
+        "prod",
+        "jb",
+        "iqr",
+        "sem",
+    )
+)
+_ANALYTIC_WINDOW_FUNCS = frozenset(
+    (
+        "lead",
+        "lag",
+        "row_number",
+        "percent_rank",
+        "dense_rank",
+        "rank",
+        "first_value",
+        "last_value",
+        "exponential_moving_average",
+        "pct_change",
+    )
+)
+_ANALYTIC_WINDOW_COL_FUNCS = frozenset(
+    ("lead", "lag", "first_value", "last_value", "pct_change")
+)
+_ANALYTIC_CORR_FUNCS = frozenset(("corr", "cov", "beta"))
+_STRIP_QUOTES = str.maketrans("", "", '"')
+_APPLY_CTYPES_MAXSIZE = 256
+# 'apply_fun' templates, filled with the 'x' parameter. The
+# other functions are applied using their upper-case name.
+_APPLY_FUN_ALIASES = {"mean": "avg", "length": "len"}
+_APPLY_FUN_TEMPLATES = {
+    "avg": "APPLY_AVG({{}})",
+    "contain": "CONTAINS({{}}, {x})",
+    "count": "APPLY_COUNT({{}})",
+    "dim": "ARRAY_DIMS({{}})",
+    "find": "ARRAY_FIND({{}}, {x})",
+    "len": "LENGTH({{}})",
+    "log": "LOG({x}, {{}})",
+    "max": "APPLY_MAX({{}})",
+    "min": "APPLY_MIN({{}})",
+    "mod": "MOD({{}}, {x})",
+    "pow": "POW({{}}, {x})",
+    "round": "ROUND({{}}, {x})",
+    "sum": "APPLY_SUM({{}})",
+}
+_APPLY_FUN_CAT_TEMPLATES = {
+    ("contain", "vmap"): "MAPCONTAINSVALUE({{}}, {x})",
+    ("len", "complex"): "APPLY_COUNT_ELEMENTS({{}})",
+    ("len", "vmap"): "MAPSIZE({{}})",
+}
+# Templates of the arithmetic and date methods.
+_ARITHMETIC_TEMPLATES = {
+    "add": "{{}} + ({x})",
+    "add_date": "TIMESTAMPADD({unit}, {x}, {{}})",
+    "div": "{{}} / ({x})",
+    "mul": "{{}} * ({x})",
+    "round": "ROUND({{}}, {x})",
+    "sub": "{{}} - ({x})",
+    "sub_date": "TIMESTAMPADD({unit}, -({x}), {{}})",
+}
+# Data types kept by the arithmetic with any finite number.
+_FLOAT_CTYPES = ("double", "float", "real")
+# Units used to write the date additions of whole
+# numbers of seconds, from the coarsest.
+_TIMESTAMPADD_UNITS = (("DAY", 86400), ("HOUR", 3600), ("MINUTE", 60))
+_SLICE_TEMPLATE = "TIME_SLICE({{}}, {length}, '{unit}', '{start_or_end}')"
+_SLICE_BOUNDS = {True: "START", False: "END"}
+_SLICE_UNITS = frozenset(
+    ("HOUR", "MINUTE", "SECOND", "MILLISECOND", "MICROSECOND", "MS", "US")
+)
+# 'apply_fun' functions for which f(f(x)) = f(x).
+_IDEMPOTENT_FUNS = frozenset(("abs", "ceil", "floor", "round", "sign"))
+_COALESCE_CONST_RE = re.compile(
+    r"^\s*COALESCE\(\s*\{\}\s*,\s*([^,()]+?)\s*\)\s*$", re.IGNORECASE
+)
+# Quoted or bare identifiers used in an 'apply' function.
+_IDENTIFIER_RE = re.compile(r'"((?:[^"]|"")*)"|\b([^\W\d]\w*)')
+
+# Scalar functions which can be fused by 'apply' when they
+# are stacked on the same vDataColumn. A fusable template
+# only uses these functions, numbers, string literals and
+# arithmetic operators: it can not reference other columns.
+# The chained arithmetic and date methods ('add', 'sub',
+# 'mul', 'round', 'slice', ...) end up in a single floor.
+_FUSABLE_FUNCS = frozenset(
+    (
+        "ABS",
+        "CBRT",
+        "CEIL",
+        "CEILING",
+        "DATE_PART",
+        "EXP",
+        "FLOOR",
+        "LN",
+        "LOG",
+        "MOD",
+        "POWER",
+        "ROUND",
+        "SIGN",
+        "SQRT",
+        "TIME_SLICE",
+        "TIMESTAMPADD",
+        "TRUNC",
+    )
+)
+_FUSABLE_TOKEN_RE = re.compile(
+    r"\s*(?:\{\}|\d+(?:\.\d*)?(?:[eE][+-]?\d+)?|\.\d+|'[^']*'|[-+*/%(),]"
+    r"|(?:DAY|HOUR|MINUTE|SECOND)\b|([A-Za-z_]+)\s*(?=\())"
+)
+
+
+def _timestampadd_args(x: PythonNumber, ctype: str) -> dict:
+    """
+    Returns the unit and the number of units used to add
+    x seconds to a date-like vDataColumn. The time zone
+    aware types keep the seconds: a day is not always
+    86400 seconds long for them.
+    """
+    if (
+        isinstance(x, int)
+        and not isinstance(x, bool)
+        and "tz" not in ctype
+        and "time zone" not in ctype
+    ):
+        for unit, seconds in _TIMESTAMPADD_UNITS:
+            if x % seconds == 0:
+                return {"unit": unit, "x": x // seconds}
+    return {"unit": "SECOND", "x": x}
+
+
+def _is_fusable(func: str) -> bool:
+    """
+    Returns True if the input 'apply' template is a
+    scalar expression of the vDataColumn only.
+    """
+    pos, n = 0, len(func)
+    while pos < n:
+        match = _FUSABLE_TOKEN_RE.match(func, pos)
+        if not match or match.end() == pos:
+            return func[pos:].isspace()
+        if match.group(1) and match.group(1).upper() not in _FUSABLE_FUNCS:
+            return False
+        pos = match.end()
+    return True
+
+
+# Analytic SQL templates. The placeholders are filled
+# using 'str.format_map' in the 'analytic' method.
+# The central moments are averaged around the window
+# mean, which is materialized first as a temporary
+# vDataColumn: expanding them from the raw moments
+# cancels catastrophically when the mean is large
+# compared to the deviation. The count and the std
+# share the partition of the final projection.
+_MOMENTS_AGG = {
+    "count": "COUNT({col}) OVER ({by})",
+    "std": "STDDEV({col}) OVER ({by})",
+    "m3": "AVG(POWER({col} - {mean}, 3)) OVER ({by})",
+    "m4": "AVG(POWER({col} - {mean}, 4)) OVER ({by})",
+}
+_SKEWNESS_SQL = (
+    "{m3} / POWER(NULLIFZERO({std}), 3) "
+    "* POWER({count}, 2) "
+    "/ NULLIFZERO(({count} - 1) * ({count} - 2))"
+)
+_KURTOSIS_SQL = (
+    "({m4} / POWER(NULLIFZERO({std}), 4) "
+    "* POWER({count}, 2) * ({count} + 1) / NULLIFZERO({count} - 1) "
+    "- 3 * POWER({count} - 1, 2)) "
+    "/ NULLIFZERO(({count} - 2) * ({count} - 3))"
+)
+_JB_SQL = (
+    "{count} / 6 * (POWER(" + _SKEWNESS_SQL + ", 2) "
+    "+ POWER(" + _KURTOSIS_SQL + ", 2) / 4)"
+)
+_MOMENTS_SQL = {
+    "kurtosis": _KURTOSIS_SQL.format_map(_MOMENTS_AGG),
+    "skewness": _SKEWNESS_SQL.format_map(_MOMENTS_AGG),
+    "jb": _JB_SQL.format_map(_MOMENTS_AGG),
+}
+_PROD_SQL = (
+    "DECODE(MIN(ABS({col})) OVER ({by}), 0, 0, "
+    "DECODE(ABS(MOD(SUM(CASE WHEN {col} < 0 THEN 1 ELSE 0 END) "
+    "OVER ({by}), 2)), 0, 1, -1) "
+    "* EXP(SUM(LN(NULLIFZERO(ABS({col})))) OVER ({by})))"
+)
+_ANALYTIC_AGG_SQL = {
+    "prod": _PROD_SQL,
+    "unique": (
+        "DENSE_RANK() OVER ({by} ORDER BY {col} ASC) "
+        "+ DENSE_RANK() OVER ({by} ORDER BY {col} DESC) - 1"
+    ),
+    "range": "MAX({col}) OVER ({by}) - MIN({col}) OVER ({by})",
+    "iqr": (
+        "PERCENTILE_CONT(0.75) WITHIN GROUP(ORDER BY {col}) OVER ({by}) "
+        "- PERCENTILE_CONT(0.25) WITHIN GROUP(ORDER BY {col}) OVER ({by})"
+    ),
+    "sem": "STDDEV({col}) OVER ({by}) / SQRT(COUNT({col}) OVER ({by}))",
+}
+_FAST_UNIQUE_SQL = "COUNT(DISTINCT {col}) OVER ({by})"
+_PERCENTILE_SQL = "PERCENTILE_CONT({x}) WITHIN GROUP(ORDER BY {col}) OVER ({by})"
+_COV_SQL = (
+    "(AVG({col} * {col2}) OVER ({by}) "
+    "- AVG({col}) OVER ({by}) * AVG({col2}) OVER ({by}))"
+)
+_ANALYTIC_CORR_SQL = {
+    "cov": _COV_SQL,
+    "corr": _COV_SQL + " / (STDDEV({col}) OVER ({by}) * STDDEV({col2}) OVER ({by}))",
+    "beta": _COV_SQL + " / (VARIANCE({col2}) OVER ({by}))",
+}
+
 
 class vDFMath(vDFFilter):
     def __abs__(self) -> "vDataFrame":
@@ -45,19 +276,11 @@ class vDFMath(vDFFilter):
 
     def __ceil__(self) -> "vDataFrame":
         vdf = self.copy()
-        columns = vdf.numcol()
-        for col in columns:
-            if vdf[col].category() == "float":
-                vdf[col].apply_fun(func="ceil")
-        return vdf
+        return vdf.apply({col: "CEIL({})" for col in vdf._float_columns()})
 
     def __floor__(self) -> "vDataFrame":
         vdf = self.copy()
-        columns = vdf.numcol()
-        for col in columns:
-            if vdf[col].category() == "float":
-                vdf[col].apply_fun(func="floor")
-        return vdf
+        return vdf.apply({col: "FLOOR({})" for col in vdf._float_columns()})
 
     def __len__(self) -> int:
         return int(self.shape()[0])
@@ -67,11 +290,21 @@ class vDFMath(vDFFilter):
 
     def __round__(self, n: int) -> "vDataFrame":
         vdf = self.copy()
-        columns = vdf.numcol()
-        for col in columns:
-            if vdf[col].category() == "float":
-                vdf[col].apply_fun(func="round", x=n)
-        return vdf
+        func = _ARITHMETIC_TEMPLATES["round"].format(x=n)
+        return vdf.apply({col: func for col in vdf._float_columns()})
+
+    def _float_columns(self) -> list[str]:
+        """
+        Returns the names of the float vDataColumns.
+        Each vDataColumn is resolved once, using its
+        formatted name, to avoid the name matching
+        done by ``__getitem__``.
+        """
+        return [
+            col
+            for col in self.get_columns()
+            if getattr(self, col).category() == "float"
+        ]
 
     @save_verticapy_logs
     def abs(self, columns: Optional[SQLColumns] = None) -> "vDataFrame":
@@ -166,7 +399,7 @@ class vDFMath(vDFFilter):
         columns = self.numcol() if not columns else self.format_colnames(columns)
         func = {}
         for column in columns:
-            if not self[column].isbool():
+            if not getattr(self, column).isbool():
                 func[column] = "ABS({})"
         return self.apply(func)
 
@@ -384,36 +617,15 @@ class vDFMath(vDFFilter):
         """
         columns, by, order_by = format_type(columns, by, order_by, dtype=list)
         columns, by = self.format_colnames(columns, by)
-        by_name = ["by"] + by if by else []
-        by_order = ["order_by"] + list(order_by) if (order_by) else []
         if not name:
+            by_name = ["by"] + by if by else []
+            by_order = ["order_by"] + list(order_by) if (order_by) else []
             name = gen_name([func] + columns + by_name + by_order)
-        func = func.lower()
         by = ", ".join(by)
         by = f"PARTITION BY {by}" if by else ""
         order_by = self._get_sort_syntax(order_by)
-        func = verticapy_agg_name(func.lower(), method="vertica")
-        if func in (
-            "max",
-            "min",
-            "avg",
-            "sum",
-            "count",
-            "stddev",
-            "median",
-            "variance",
-            "unique",
-            "top",
-            "kurtosis",
-            "skewness",
-            "mad",
-            "aad",
-            "range",
-            "prod",
-            "jb",
-            "iqr",
-            "sem",
-        ) or ("%" in func):
+        func = verticapy_agg_name(func, method="vertica")
+        if func in _ANALYTIC_AGG_FUNCS or ("%" in func):
             if order_by and not conf.get_option("print_info"):
                 print(
                     f"\u26A0 '{func}' analytic method doesn't need an "
@@ -424,66 +636,37 @@ class vDFMath(vDFFilter):
                     "The parameter 'column' must be a vDataFrame Column "
                     f"when using analytic method '{func}'"
                 )
-            if func in ("skewness", "kurtosis", "aad", "mad", "jb"):
-                random_nb = random.randint(0, 10000000)
-                column_str = columns[0].replace('"', "")
-                mean_name = f"{column_str}_mean_{random_nb}"
-                median_name = f"{column_str}_median_{random_nb}"
-                std_name = f"{column_str}_std_{random_nb}"
-                count_name = f"{column_str}_count_{random_nb}"
+            sql_params = {"col": columns[0], "by": by}
+            if func == "unique" and conf.get_option("fast_unique"):
+                self.eval(name, _FAST_UNIQUE_SQL.format_map(sql_params))
+            elif func in _ANALYTIC_AGG_SQL:
+                self.eval(name, _ANALYTIC_AGG_SQL[func].format_map(sql_params))
+            elif func in _MOMENTS_SQL or func in ("aad", "mad"):
+                self._vars["tmp_seq"] = self._vars.get("tmp_seq", 0) + 1
+                tmp_nb = self._vars["tmp_seq"]
+                column_str = columns[0].translate(_STRIP_QUOTES)
+                mean_name = f"{column_str}_mean_{tmp_nb}"
+                median_name = f"{column_str}_median_{tmp_nb}"
                 if func == "mad":
                     self.eval(median_name, f"MEDIAN({columns[0]}) OVER ({by})")
-                else:
-                    self.eval(mean_name, f"AVG({columns[0]}) OVER ({by})")
-                if func not in ("aad", "mad"):
-                    self.eval(std_name, f"STDDEV({columns[0]}) OVER ({by})")
-                    self.eval(count_name, f"COUNT({columns[0]}) OVER ({by})")
-                if func == "kurtosis":
-                    self.eval(
-                        name,
-                        f"""AVG(POWER(({columns[0]} - {mean_name}) 
-                          / NULLIFZERO({std_name}), 4)) OVER ({by}) 
-                          * POWER({count_name}, 2) 
-                          * ({count_name} + 1) 
-                          / NULLIFZERO(({count_name} - 1) 
-                          * ({count_name} - 2) 
-                          * ({count_name} - 3)) 
-                          - 3 * POWER({count_name} - 1, 2) 
-                          / NULLIFZERO(({count_name} - 2) 
-                          * ({count_name} - 3))""",
-                    )
-                elif func == "skewness":
-                    self.eval(
-                        name,
-                        f"""AVG(POWER(({columns[0]} - {mean_name}) 
-                         / NULLIFZERO({std_name}), 3)) OVER ({by}) 
-                         * POWER({count_name}, 2) 
-                         / NULLIFZERO(({count_name} - 1) 
-                         * ({count_name} - 2))""",
-                    )
-                elif func == "jb":
-                    self.eval(
-                        name,
-                        f"""{count_name} / 6 * (POWER(AVG(POWER(({columns[0]} 
-                          - {mean_name}) / NULLIFZERO({std_name}), 3)) OVER ({by}) 
-                          * POWER({count_name}, 2) / NULLIFZERO(({count_name} - 1) 
-                          * ({count_name} - 2)), 2) + POWER(AVG(POWER(({columns[0]} 
-                          - {mean_name}) / NULLIFZERO({std_name}), 4)) OVER ({by}) 
-                          * POWER({count_name}, 2) * ({count_name} + 1) 
-                          / NULLIFZERO(({count_name} - 1) * ({count_name} - 2) 
-                          * ({count_name} - 3)) - 3 * POWER({count_name} - 1, 2) 
-                          / NULLIFZERO(({count_name} - 2) * ({count_name} - 3)), 2) / 4)""",
-                    )
-                elif func == "aad":
-                    self.eval(
-                        name,
-                        f"AVG(ABS({columns[0]} - {mean_name})) OVER ({by})",
-                    )
-                elif func == "mad":
                     self.eval(
                         name,
                         f"MEDIAN(ABS({columns[0]} - {median_name})) OVER ({by})",
                     )
+                else:
+                    self.eval(mean_name, f"AVG({columns[0]}) OVER ({by})")
+                    if func == "aad":
+                        self.eval(
+                            name,
+                            f"AVG(ABS({columns[0]} - {mean_name})) OVER ({by})",
+                        )
+                    else:
+                        self.eval(
+                            name,
+                            _MOMENTS_SQL[func].format_map(
+                                {**sql_params, "mean": mean_name}
+                            ),
+                        )
             elif func == "top":
                 if not by:
                     by_str = f"PARTITION BY {columns[0]}"
@@ -491,7 +674,7 @@ class vDFMath(vDFFilter):
                     by_str = f"{by}, {columns[0]}"
                 self.eval(name, f"ROW_NUMBER() OVER ({by_str})")
                 if add_count:
-                    name_str = name.replace('"', "")
+                    name_str = name.translate(_STRIP_QUOTES)
                     self.eval(
                         f"{name_str}_count",
                         f"NTH_VALUE({name}, 1) OVER ({by} ORDER BY {name} DESC)",
@@ -499,12 +682,6 @@ class vDFMath(vDFFilter):
                 self[name].apply(
                     f"NTH_VALUE({columns[0]}, 1) OVER ({by} ORDER BY {{}} DESC)"
                 )
-            elif func == "unique":
-                self.eval(
-                    name,
-                    f"""DENSE_RANK() OVER ({by} ORDER BY {columns[0]} ASC) 
-                      + DENSE_RANK() OVER ({by} ORDER BY {columns[0]} DESC) - 1""",
-                )
             elif "%" == func[-1]:
                 try:
                     x = float(func[0:-1]) / 100
@@ -515,68 +692,20 @@ class vDFMath(vDFFilter):
                         "element please write 'x%' with x > 0. Example: "
                         "50% for the median."
                     )
-                self.eval(
-                    name,
-                    f"PERCENTILE_CONT({x}) WITHIN GROUP(ORDER BY {columns[0]}) OVER ({by})",
-                )
-            elif func == "range":
-                self.eval(
-                    name,
-                    f"MAX({columns[0]}) OVER ({by}) - MIN({columns[0]}) OVER ({by})",
-                )
-            elif func == "iqr":
-                self.eval(
-                    name,
-                    f"""PERCENTILE_CONT(0.75) WITHIN GROUP(ORDER BY {columns[0]}) OVER ({by}) 
-                      - PERCENTILE_CONT(0.25) WITHIN GROUP(ORDER BY {columns[0]}) OVER ({by})""",
-                )
-            elif func == "sem":
-                self.eval(
-                    name,
-                    f"STDDEV({columns[0]}) OVER ({by}) / SQRT(COUNT({columns[0]}) OVER ({by}))",
-                )
-            elif func == "prod":
-                self.eval(
-                    name,
-                    f"""DECODE(ABS(MOD(SUM(CASE 
-                                            WHEN {columns[0]} < 0 
-                                            THEN 1 ELSE 0 END) 
-                                       OVER ({by}), 2)), 0, 1, -1) 
-                     * POWER(10, SUM(LOG(ABS({columns[0]}))) 
-                                 OVER ({by}))""",
-                )
+                sql_params["x"] = x
+                self.eval(name, _PERCENTILE_SQL.format_map(sql_params))
             else:
                 self.eval(name, f"{func.upper()}({columns[0]}) OVER ({by})")
-        elif func in (
-            "lead",
-            "lag",
-            "row_number",
-            "percent_rank",
-            "dense_rank",
-            "rank",
-            "first_value",
-            "last_value",
-            "exponential_moving_average",
-            "pct_change",
-        ):
-            if not columns and func in (
-                "lead",
-                "lag",
-                "first_value",
-                "last_value",
-                "pct_change",
-            ):
+        elif func in _ANALYTIC_WINDOW_FUNCS:
+            if not columns and func in _ANALYTIC_WINDOW_COL_FUNCS:
                 raise ValueError(
                     "The parameter 'columns' must be a vDataFrame column when "
                     f"using analytic method '{func}'"
                 )
-            if (columns) and func not in (
-                "lead",
-                "lag",
-                "first_value",
-                "last_value",
-                "pct_change",
-                "exponential_moving_average",
+            if (
+                (columns)
+                and func not in _ANALYTIC_WINDOW_COL_FUNCS
+                and func != "exponential_moving_average"
             ):
                 raise ValueError(
                     "The parameter 'columns' must be empty when using analytic"
@@ -603,32 +732,26 @@ class vDFMath(vDFFilter):
                     name,
                     f"{func.upper()}({columns0}{info_param}) OVER ({by}{order_by})",
                 )
-        elif func in ("corr", "cov", "beta"):
+        elif func in _ANALYTIC_CORR_FUNCS:
             if order_by:
                 print(
                     f"\u26A0 '{func}' analytic method doesn't need an "
                     "order by clause, it was ignored"
                 )
-            assert len(columns) == 2, MissingColumn(
-                "The parameter 'columns' includes 2 vDataColumns when using "
-                f"analytic method '{func}'"
-            )
+            if len(columns) != 2:
+                raise MissingColumn(
+                    "The parameter 'columns' includes 2 vDataColumns when using "
+                    f"analytic method '{func}'"
+                )
             if columns[0] == columns[1]:
                 if func == "cov":
                     expr = f"VARIANCE({columns[0]}) OVER ({by})"
                 else:
                     expr = 1
             else:
-                if func == "corr":
-                    den = f" / (STDDEV({columns[0]}) OVER ({by}) * STDDEV({columns[1]}) OVER ({by}))"
-                elif func == "beta":
-                    den = f" / (VARIANCE({columns[1]}) OVER ({by}))"
-                else:
-                    den = ""
-                expr = f"""
-                    (AVG({columns[0]} * {columns[1]}) OVER ({by}) 
-                   - AVG({columns[0]}) OVER ({by}) 
-                   * AVG({columns[1]}) OVER ({by})){den}"""
+                expr = _ANALYTIC_CORR_SQL[func].format_map(
+                    {"col": columns[0], "col2": columns[1], "by": by}
+                )
             self.eval(name, expr)
         else:
             try:
@@ -642,16 +765,12 @@ class vDFMath(vDFFilter):
                     "managed by the 'analytic' method. If you want more "
                     "flexibility use the 'eval' method."
                 )
-        if func in ("kurtosis", "skewness", "jb"):
-            self._vars["exclude_columns"] += [
-                quote_ident(mean_name),
-                quote_ident(std_name),
-                quote_ident(count_name),
-            ]
-        elif func == "aad":
-            self._vars["exclude_columns"] += [quote_ident(mean_name)]
+        # The temporary names are generated without
+        # double quotes, no need to use 'quote_ident'.
+        if func == "aad" or func in _MOMENTS_SQL:
+            self._vars["exclude_columns"].add(f'"{mean_name}"')
         elif func == "mad":
-            self._vars["exclude_columns"] += [quote_ident(median_name)]
+            self._vars["exclude_columns"].add(f'"{median_name}"')
         return self
 
     @save_verticapy_logs
@@ -770,8 +889,63 @@ class vDFMath(vDFFilter):
             | :py:meth:`verticapy.vDataFrame.applymap` : Apply functions to all columns.
         """
         func = self.format_colnames(func)
-        for column in func:
-            self[column].apply(func[column])
+        if not func:
+            return self
+        if len(func) > 1:
+            return self._apply_batch(func)
+        # 'format_colnames' returns the vDataColumns
+        # names, they can be accessed directly.
+        for column, expr in func.items():
+            getattr(self, column).apply(expr)
+        return self
+
+    def _apply_batch(self, func: dict) -> "vDataFrame":
+        """
+        Applies each function of the formatted dictionary
+        using a single query to get all the data types.
+        The functions are applied one by one when one of
+        them uses another transformed vDataColumn, or if
+        the batch query fails, to keep the same result
+        and error messages as the vDataColumn method.
+        """
+        func = {column: str(expr) for column, expr in func.items()}
+        # The identifiers of each function are matched against
+        # the names of the batch, quoted or not, in one pass.
+        batch_columns = {
+            column.translate(_STRIP_QUOTES).lower(): column for column in func
+        }
+        is_batchable = True
+        for column, expr in func.items():
+            for match in _IDENTIFIER_RE.finditer(expr):
+                ident = match.group(1) if match.group(1) is not None else match.group(2)
+                other_column = batch_columns.get(ident.lower())
+                if other_column is not None and other_column != column:
+                    is_batchable = False
+                    break
+            if not is_batchable:
+                break
+        ctypes = None
+        if is_batchable:
+            func_apply = ", ".join(
+                f"{expr.replace('{}', column)} AS apply_test_feature_{i}"
+                for i, (column, expr) in enumerate(func.items())
+            )
+            # Only a failing probe query falls back to one probe
+            # per column; any other error, such as a connection
+            # one, is raised.
+            try:
+                ctypes = get_data_types(
+                    expr=f"SELECT {func_apply} FROM {self} LIMIT 0",
+                )
+            except QueryError:
+                ctypes = None
+        if not ctypes or len(ctypes) != len(func):
+            for column, expr in func.items():
+                getattr(self, column).apply(expr)
+        else:
+            for (column, expr), ctype in zip(func.items(), ctypes):
+                getattr(self, column)._apply_transf(expr, ctype[1], erase_catalog=False)
+            self._update_catalog(erase=True, columns=list(func))
         return self
 
     @save_verticapy_logs
@@ -882,21 +1056,245 @@ class vDFMath(vDFFilter):
             | :py:meth:`verticapy.vDataFrame.analytic` : Advanced Analytical functions.
             | :py:meth:`verticapy.vDataFrame.apply` : Apply functions using a dictionary.
         """
+        # COALESCE with the column and a single constant is
+        # written using its two-argument form, NVL.
+        func = _COALESCE_CONST_RE.sub(r"NVL({}, \1)", func)
+        # The data types are read from the vDataColumns, which
+        # are resolved once to check both the numerical and
+        # the boolean types.
         function = {}
-        columns = self.numcol() if numeric_only else self.get_columns()
-        for column in columns:
+        for column in self.get_columns():
+            vdc = getattr(self, column)
+            if numeric_only and not vdc.isnum():
+                continue
             function[column] = (
-                func if not self[column].isbool() else func.replace("{}", "{}::int")
+                func if not vdc.isbool() else func.replace("{}", "{}::int")
+            )
+        if not function:
+            return self
+        # The columns are already formatted, all the data
+        # types are retrieved using a single query.
+        return self._apply_batch(function)
+
+    def _apply_arithmetic(self, method: str, x: dict) -> "vDataFrame":
+        """
+        Applies the arithmetic method to each input vDataColumn
+        with its own value. All the functions go through the
+        same 'apply' call: the data types are retrieved using
+        a single query.
+        """
+        func = {}
+        for column, val in self.format_colnames(x).items():
+            vdc = getattr(self, column)
+            if method == "sub" and vdc.category() == "date":
+                func[column] = _ARITHMETIC_TEMPLATES["sub_date"].format_map(
+                    _timestampadd_args(val, vdc.ctype())
+                )
+            else:
+                func[column] = _ARITHMETIC_TEMPLATES[method].format(x=val)
+        return self.apply(func)
+
+    @save_verticapy_logs
+    def mul(self, x: dict) -> "vDataFrame":
+        """
+        Multiplies each input vDataColumn by its own element.
+
+        Parameters
+        ----------
+        x: dict
+            Dictionary of the elements used to multiply the
+            vDataColumns. For example, to multiply "x" by 2
+            and "y" by 3: {"x": 2, "y": 3}
+
+        Returns
+        -------
+        vDataFrame
+            self
+
+        Examples
+        --------
+        Let's begin by importing `VerticaPy`.
+
+        .. ipython:: python
+
+            import verticapy as vp
+
+        Let us create a dummy dataset:
+
+        .. ipython:: python
+
+            vdf = vp.vDataFrame({"x": [1, 2, 3], "y": [4, 5, 6]})
+
+        Now we can multiply both columns at once:
+
+        .. code-block:: python
+
+            vdf.mul({"x": 2, "y": 10})
+
+        .. ipython:: python
+            :suppress:
+
+            vdf.mul({"x": 2, "y": 10})
+            result = vdf
+            html_file = open("SPHINX_DIRECTORY/figures/core_vDataFrame_math_mul.html", "w")
+            html_file.write(result._repr_html_())
+            html_file.close()
+
+        .. raw:: html
+            :file: SPHINX_DIRECTORY/figures/core_vDataFrame_math_mul.html
+
+        .. seealso::
+
+            | :py:meth:`verticapy.vDataColumn.mul` : Multiplies
+                the :py:class:`vDataColumn` by a value.
+            | :py:meth:`verticapy.vDataFrame.apply` : Apply functions
+                using a dictionary.
+        """
+        return self._apply_arithmetic("mul", x)
+
+    @save_verticapy_logs
+    def round(self, n: dict) -> "vDataFrame":
+        """
+        Rounds each input vDataColumn by keeping only its own
+        number of digits after the decimal point.
+
+        Parameters
+        ----------
+        n: dict
+            Dictionary of the number of digits to keep after
+            the decimal point for each vDataColumn. For example,
+            to round "x" to 1 digit and "y" to 2 digits:
+            {"x": 1, "y": 2}
+
+        Returns
+        -------
+        vDataFrame
+            self
+
+        Examples
+        --------
+        Let's begin by importing `VerticaPy`.
+
+        .. ipython:: python
+
+            import verticapy as vp
+
+        Let us create a dummy dataset:
+
+        .. ipython:: python
+
+            vdf = vp.vDataFrame(
+                {
+                    "x": [1.123, 2.345, 3.567],
+                    "y": [4.123, 5.345, 6.567],
+                },
             )
-        return self.apply(function)
+
+        Now we can round both columns at once:
+
+        .. code-block:: python
+
+            vdf.round({"x": 1, "y": 2})
+
+        .. ipython:: python
+            :suppress:
+
+            vdf.round({"x": 1, "y": 2})
+            result = vdf
+            html_file = open("SPHINX_DIRECTORY/figures/core_vDataFrame_math_round.html", "w")
+            html_file.write(result._repr_html_())
+            html_file.close()
+
+        .. raw:: html
+            :file: SPHINX_DIRECTORY/figures/core_vDataFrame_math_round.html
+
+        .. seealso::
+
+            | :py:meth:`verticapy.vDataColumn.round` : Rounds
+                the :py:class:`vDataColumn`.
+            | :py:meth:`verticapy.vDataFrame.apply` : Apply functions
+                using a dictionary.
+        """
+        return self._apply_arithmetic("round", n)
+
+    @save_verticapy_logs
+    def sub(self, x: dict) -> "vDataFrame":
+        """
+        Subtracts from each input vDataColumn its own element.
+        For the date-like vDataColumns, the element is a number
+        of seconds.
+
+        Parameters
+        ----------
+        x: dict
+            Dictionary of the elements to subtract from the
+            vDataColumns. For example, to subtract 2 from "x"
+            and 3 from "y": {"x": 2, "y": 3}
+
+        Returns
+        -------
+        vDataFrame
+            self
+
+        Examples
+        --------
+        Let's begin by importing `VerticaPy`.
+
+        .. ipython:: python
+
+            import verticapy as vp
+
+        Let us create a dummy dataset:
+
+        .. ipython:: python
+
+            vdf = vp.vDataFrame({"x": [1, 2, 3], "y": [4, 5, 6]})
+
+        Now we can subtract from both columns at once:
+
+        .. code-block:: python
+
+            vdf.sub({"x": 1, "y": 4})
+
+        .. ipython:: python
+            :suppress:
+
+            vdf.sub({"x": 1, "y": 4})
+            result = vdf
+            html_file = open("SPHINX_DIRECTORY/figures/core_vDataFrame_math_sub.html", "w")
+            html_file.write(result._repr_html_())
+            html_file.close()
+
+        .. raw:: html
+            :file: SPHINX_DIRECTORY/figures/core_vDataFrame_math_sub.html
+
+        .. seealso::
+
+            | :py:meth:`verticapy.vDataColumn.sub` : Subtracts
+                a value from the :py:class:`vDataColumn`.
+            | :py:meth:`verticapy.vDataFrame.apply` : Apply functions
+                using a dictionary.
+        """
+        return self._apply_arithmetic("sub", x)
 
 
 class vDCMath(vDCFilter):
     def __len__(self) -> int:
-        return int(self.count())
+        return int(self._count())
 
     def __nonzero__(self) -> bool:
-        return self.count() > 0
+        return self._count() > 0
+
+    def _count(self) -> int:
+        """
+        Returns the vDataColumn count, reading it from the
+        catalog when it was already computed. The catalog is
+        erased whenever the vDataColumn is transformed.
+        """
+        count = self._parent._get_catalog_value(self._alias, "count")
+        if isinstance(count, (int, float)) and not isinstance(count, bool):
+            return count
+        return self.count()
 
     @save_verticapy_logs
     def abs(self) -> "vDataFrame":
@@ -1073,10 +1471,45 @@ class vDCMath(vDCFilter):
             | :py:meth:`verticapy.vDataColumn.div` :
                 Divide the :py:class:`vDataColumn` by a value.
         """
-        if self.isdate():
-            return self.apply(func=f"TIMESTAMPADD(SECOND, {x}, {{}})")
+        # The category is read from the last transformation.
+        category = self.category()
+        if category == "date":
+            return self.apply(
+                func=_ARITHMETIC_TEMPLATES["add_date"].format_map(
+                    _timestampadd_args(x, self.ctype())
+                )
+            )
+        elif x == 0 and category in ("int", "float") and not self.isbool():
+            return self._parent
         else:
-            return self.apply(func=f"{{}} + ({x})")
+            return self._apply_arithmetic(_ARITHMETIC_TEMPLATES["add"].format(x=x), x)
+
+    def _apply_arithmetic(
+        self, func: str, x: PythonNumber, int_ctype: bool = True
+    ) -> "vDataFrame":
+        """
+        Applies the arithmetic function of the vDataColumn
+        and of the number x. Floats with any finite number
+        and integers with integers keep their data type:
+        the function is then stacked without querying the
+        database, and chained operations stay in Python
+        until the vDataFrame is used.
+        """
+        ctype = self._transf[-1][1]
+        if isinstance(x, (int, float)) and not isinstance(x, bool):
+            if ctype.lower().startswith(_FLOAT_CTYPES) and math.isfinite(x):
+                self._apply_transf(func, ctype)
+                return self._parent
+            elif (
+                int_ctype
+                and isinstance(x, int)
+                and abs(x) < 2**63
+                and self.category() == "int"
+                and not self.isbool()
+            ):
+                self._apply_transf(func, ctype)
+                return self._parent
+        return self.apply(func=func)
 
     @save_verticapy_logs
     def apply(
@@ -1213,57 +1646,117 @@ class vDCMath(vDCFilter):
         """
         if isinstance(func, StringSQL):
             func = str(func)
+        if func.strip() == "{}" and not copy_name:
+            return self._parent
         func_apply = func.replace("{}", self._alias)
-        alias_sql_repr = self._alias.replace('"', "")
+        alias_sql_repr = self._alias.translate(_STRIP_QUOTES)
         try:
-            ctype = get_data_types(
-                expr=f"""
+            # The data types are memoized by query. The query
+            # embeds the current relation, which changes with
+            # every transformation. The memo is only valid while
+            # the relation the vDataFrame points to is unchanged
+            # in the database.
+            query = f"""
                     SELECT 
                         {func_apply} AS apply_test_feature 
                     FROM {self._parent} 
                     WHERE {self} IS NOT NULL 
-                    LIMIT 0""",
-                column="apply_test_feature",
-            )
-            category = to_category(ctype=ctype)
-            all_cols, max_floor = self._parent.get_columns(), 0
-            for column in all_cols:
-                try:
-                    column_str = column.replace('"', "")
-                    if (quote_ident(column) in func) or (
-                        re.search(
-                            re.compile(f"\\b{column_str}\\b"),
-                            func,
-                        )
-                    ):
-                        max_floor = max(len(self._parent[column]._transf), max_floor)
-                except:
-                    pass
-            max_floor -= len(self._transf)
-            if copy_name:
-                copy_name_str = copy_name.replace('"', "")
-                self.add_copy(name=copy_name_str)
-                self._parent[copy_name_str]._transf += [
-                    ("{}", self.ctype(), self.category())
-                ] * max_floor
-                self._parent[copy_name_str]._transf += [(func, ctype, category)]
-                self._parent[copy_name_str]._catalog = self._catalog
+                    LIMIT 0"""
+            apply_ctypes = self._parent._vars.setdefault("apply_ctypes", {})
+            if query in apply_ctypes:
+                ctype = apply_ctypes[query]
             else:
-                for k in range(max_floor):
-                    self._transf += [("{}", self.ctype(), self.category())]
-                self._transf += [(func, ctype, category)]
-                self._parent._update_catalog(erase=True, columns=[self._alias])
-            self._parent._add_to_history(
-                f"[Apply]: The vDataColumn '{alias_sql_repr}' was "
-                f"transformed with the func 'x -> {func_apply}'."
-            )
+                ctype = get_data_types(expr=query, column="apply_test_feature")
+                if ctype:
+                    if len(apply_ctypes) >= _APPLY_CTYPES_MAXSIZE:
+                        apply_ctypes.clear()
+                    apply_ctypes[query] = ctype
+            self._apply_transf(func, ctype, copy_name=copy_name)
             return self._parent
         except Exception as e:
-            raise QueryError(
+            raise vQueryError(
                 f"{e}\nError when applying the func 'x -> {func_apply}' "
                 f"to '{alias_sql_repr}'"
             )
 
+    def _apply_transf(
+        self,
+        func: str,
+        ctype: str,
+        copy_name: Optional[str] = None,
+        erase_catalog: bool = True,
+    ) -> None:
+        """
+        Adds the function to the vDataColumn transformations
+        once its resulting data type is known. The catalog
+        erasure can be left to the caller when it applies
+        multiple functions.
+        """
+        func_apply = func.replace("{}", self._alias)
+        alias_sql_repr = self._alias.translate(_STRIP_QUOTES)
+        category = to_category(ctype=ctype)
+        # The identifiers are extracted from the function once.
+        # The vDataColumns are stored as attributes under their
+        # quoted names, they are found without listing all the
+        # vDataFrame columns.
+        max_floor = len(self._transf)
+        for match in _IDENTIFIER_RE.finditer(func):
+            if match.group(1) is not None:
+                vdc = getattr(self._parent, f'"{match.group(1)}"', None)
+            else:
+                vdc = getattr(self._parent, f'"{match.group(2)}"', None)
+            if isinstance(vdc, vDCMath):
+                max_floor = max(len(vdc._transf), max_floor)
+        max_floor -= len(self._transf)
+        if copy_name:
+            copy_name_str = copy_name.translate(_STRIP_QUOTES)
+            self.add_copy(name=copy_name_str)
+            # The copy is stored under its quoted name, it is
+            # reached once without formatting the column names.
+            vdc_copy = getattr(self._parent, quote_ident(copy_name_str))
+            vdc_copy._transf += [("{}", self.ctype(), self.category())] * max_floor
+            vdc_copy._transf += [(func, ctype, category)]
+            vdc_copy._catalog = self._catalog
+        else:
+            for k in range(max_floor):
+                self._transf += [("{}", self.ctype(), self.category())]
+            self._transf += [(func, ctype, category)]
+            self._fuse_tail_transf()
+            if erase_catalog:
+                self._parent._update_catalog(erase=True, columns=[self._alias])
+        self._parent._add_to_history(
+            f"[Apply]: The vDataColumn '{alias_sql_repr}' was "
+            f"transformed with the func 'x -> {func_apply}'."
+        )
+
+    def _fuse_tail_transf(self) -> None:
+        """
+        Merges the last two transformations of the vDataColumn
+        into a single floor when both are scalar expressions of
+        the vDataColumn only. Nothing else may depend on the
+        intermediate floor: no other vDataColumn is as deep and
+        no filter or sort is defined at that position.
+        """
+        n = len(self._transf)
+        if n < 3:
+            return
+        inner, outer = self._transf[-2][0], self._transf[-1][0]
+        if outer.count("{}") != 1 or not (_is_fusable(inner) and _is_fusable(outer)):
+            return
+        for column in self._parent._vars["columns"]:
+            if (
+                column != self._alias
+                and len(getattr(self._parent, column)._transf) >= n
+            ):
+                return
+        if any(pos >= n - 2 for _, pos in self._parent._vars["where"]) or any(
+            pos >= n - 2 for pos in self._parent._vars["order_by"]
+        ):
+            return
+        if inner != "{}":
+            outer = outer.replace("{}", f"({inner})")
+        self._transf = self._transf[:-2] + [(outer,) + tuple(self._transf[-1][1:])]
+
     @save_verticapy_logs
     def apply_fun(
         self,
@@ -1465,41 +1958,51 @@ class vDCMath(vDCFilter):
             | :py:meth:`verticapy.vDataColumn.apply` :
                 Applies a function to the :py:class:`vDataColumn`.
         """
-        if func == "mean":
-            func = "avg"
-        elif func == "length":
-            func = "len"
-        cat = self.category()
-        if func == "len":
-            if cat == "vmap":
-                func = "MAPSIZE"
-            elif cat == "complex":
-                func = "APPLY_COUNT_ELEMENTS"
-            else:
-                func = "LENTGH"
-        elif func in ("max", "min", "sum", "avg", "count"):
-            func = "APPLY_" + func
-        elif func == "dim":
-            func = "ARRAY_DIMS"
-        if func not in ("log", "mod", "pow", "round", "contain", "find"):
+        func = _APPLY_FUN_ALIASES.get(func, func)
+        template = _APPLY_FUN_CAT_TEMPLATES.get((func, self.category()))
+        if not template:
+            template = _APPLY_FUN_TEMPLATES.get(func)
+        if not template:
             expr = f"{func.upper()}({{}})"
-        elif func in ("log",):
-            expr = f"{func.upper()}({x}, {{}})"
-        elif func in ("mod", "pow", "round"):
-            expr = f"{func.upper()}({{}}, {x})"
-        elif func in ("contain", "find"):
-            if func == "contain":
-                if cat == "vmap":
-                    f = "MAPCONTAINSVALUE"
-                else:
-                    f = "CONTAINS"
-            elif func == "find":
-                f = "ARRAY_FIND"
-            if isinstance(x, str):
+        else:
+            if func in ("contain", "find") and isinstance(x, str):
                 x = "'" + str(x).replace("'", "''") + "'"
-            expr = f"{f}({{}}, {x})"
+            expr = template.format(x=x)
+        if self._is_noop_fun(func, expr, x):
+            return self._parent
         return self.apply(func=expr)
 
+    def _is_noop_fun(self, func: str, expr: Optional[str], x: PythonScalar) -> bool:
+        """
+        Returns True if applying the idempotent function
+        would not change the vDataColumn: integers are
+        already rounded and 'ABS(ABS(x)) = ABS(x)'.
+        """
+        if func not in _IDEMPOTENT_FUNS:
+            return False
+        round_digits = func != "round" or (
+            isinstance(x, int) and not isinstance(x, bool) and x >= 0
+        )
+        if func in ("ceil", "floor", "round") and round_digits:
+            if self.category() == "int" and not self.isbool():
+                return True
+        if len(self._transf) < 2 or not round_digits:
+            return False
+        # The last transformation must be the same function
+        # wrapping the entire expression.
+        last_func, prefix = self._transf[-1][0].strip(), f"{func.upper()}("
+        if not (last_func.upper().startswith(prefix) and last_func.endswith(")")):
+            return False
+        depth = 0
+        for i in range(len(prefix) - 1, len(last_func)):
+            if last_func[i] == "(":
+                depth += 1
+            elif last_func[i] == ")":
+                depth -= 1
+                if depth == 0 and i != len(last_func) - 1:
+                    return False
+        return func != "round" or last_func.endswith(f", {x})")
+
     @save_verticapy_logs
     def date_part(self, field: str) -> "vDataFrame":
         """
@@ -1702,8 +2205,13 @@ class vDCMath(vDCFilter):
             | :py:meth:`verticapy.vDataColumn.add` :
                 Add a value to the :py:class:`vDataColumn`.
         """
-        assert x != 0, ValueError("Division by 0 is forbidden !")
-        return self.apply(func=f"{{}} / ({x})")
+        if x == 0:
+            raise ValueError("Division by 0 is forbidden !")
+        # Dividing integers returns a numeric, only
+        # the floats are unchanged by 'div(1)'.
+        if x == 1 and self.category() == "float":
+            return self._parent
+        return self.apply(func=_ARITHMETIC_TEMPLATES["div"].format(x=x))
 
     def get_len(self) -> "vDataColumn":
         """
@@ -1791,21 +2299,18 @@ class vDCMath(vDCFilter):
             | :py:meth:`verticapy.vDataColumn.date_part` :
                 Extracts a specific TS field  from the :py:class:`vDataColumn`.
         """
-        cat = self.category()
-        if cat == "vmap":
-            fun = "MAPSIZE"
-        elif cat == "complex":
-            fun = "APPLY_COUNT_ELEMENTS"
-        else:
-            fun = "LENGTH"
-        elem_to_select = f"{fun}({self})"
-        init_transf = f"{fun}({self._init_transf})"
+        # Same functions as 'apply_fun("len")'.
+        func = _APPLY_FUN_CAT_TEMPLATES.get(
+            ("len", self.category()), _APPLY_FUN_TEMPLATES["len"]
+        ).format()
+        elem_to_select = func.replace("{}", str(self))
+        init_transf = func.replace("{}", self._init_transf)
         new_alias = quote_ident(self._alias[1:-1] + ".length")
-        query = f"""
-            SELECT 
-                {elem_to_select} AS {new_alias} 
-            FROM {self._parent}"""
-        vcol = create_new_vdf(query)[new_alias]
+        query = f"SELECT {elem_to_select} AS {new_alias} FROM {self._parent}"
+        # All the length functions return integers: the data
+        # type does not need to be queried.
+        dtypes = [(new_alias[1:-1].replace('""', '"'), "Integer")]
+        vcol = create_new_vdf(query, _dtypes=dtypes)[new_alias]
         vcol._init_transf = init_transf
         return vcol
 
@@ -1899,7 +2404,11 @@ class vDCMath(vDCFilter):
             | :py:meth:`verticapy.vDataFrame.abs` : Get the
                 absolute value of mutiple :py:class:`vDataColumn`.
         """
-        return self.apply(func=f"ROUND({{}}, {n})")
+        if self._is_noop_fun("round", None, n):
+            return self._parent
+        return self._apply_arithmetic(
+            _ARITHMETIC_TEMPLATES["round"].format(x=n), n, int_ctype=False
+        )
 
     @save_verticapy_logs
     def mul(self, x: PythonNumber) -> "vDataFrame":
@@ -1990,7 +2499,9 @@ class vDCMath(vDCFilter):
             | :py:meth:`verticapy.vDataColumn.div` :
                 Divide the :py:class:`vDataColumn` by a value.
         """
-        return self.apply(func=f"{{}} * ({x})")
+        if x == 1 and self.isnum() and not self.isbool():
+            return self._parent
+        return self._apply_arithmetic(_ARITHMETIC_TEMPLATES["mul"].format(x=x), x)
 
     @save_verticapy_logs
     def slice(
@@ -2003,9 +2514,11 @@ class vDCMath(vDCFilter):
         Parameters
         ----------
         length: int
-            Slice size.
+            Slice size, a strictly positive integer.
         unit: str, optional
-            Slice size unit. For example, 'minute', 'hour'...
+            Slice size unit, one of the following:
+            'hour', 'minute', 'second', 'millisecond'
+            ('ms') or 'microsecond' ('us').
         start: bool, optional
             If set to True, the record is sliced using the floor
             of the slicing instead of the ceiling.
@@ -2108,10 +2621,26 @@ class vDCMath(vDCFilter):
                 a specific TS field  from the :py:class:`vDataColumn`.
 
         """
-        start_or_end = "START" if (start) else "END"
+        if (
+            isinstance(length, bool)
+            or not isinstance(length, numbers.Integral)
+            or length <= 0
+        ):
+            raise ValueError(
+                f"Parameter 'length' must be a strictly positive integer, found '{length}'."
+            )
+        start_or_end = _SLICE_BOUNDS[bool(start)]
         unit = unit.upper()
+        # The unit is written as a string literal in the SQL.
+        if unit not in _SLICE_UNITS:
+            raise ValueError(
+                f"Parameter 'unit' must be in ({', '.join(sorted(_SLICE_UNITS))}), "
+                f"found '{unit}'."
+            )
         return self.apply(
-            func=f"TIME_SLICE({{}}, {length}, '{unit}', '{start_or_end}')"
+            func=_SLICE_TEMPLATE.format(
+                length=length, unit=unit, start_or_end=start_or_end
+            )
         )
 
     @save_verticapy_logs
@@ -2205,7 +2734,15 @@ class vDCMath(vDCFilter):
             | :py:meth:`verticapy.vDataColumn.add` :
                 Add a value to the entire :py:class:`vDataColumn`.
         """
-        if self.isdate():
-            return self.apply(func=f"TIMESTAMPADD(SECOND, -({x}), {{}})")
+        # The category is read from the last transformation.
+        category = self.category()
+        if category == "date":
+            return self.apply(
+                func=_ARITHMETIC_TEMPLATES["sub_date"].format_map(
+                    _timestampadd_args(x, self.ctype())
+                )
+            )
+        elif x == 0 and category in ("int", "float") and not self.isbool():
+            return self._parent
         else:
-            return self.apply(func=f"{{}} - ({x})")
+            return self._apply_arithmetic(_ARITHMETIC_TEMPLATES["sub"].format(x=x), x)
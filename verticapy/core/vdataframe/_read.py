@@ -261,10 +261,10 @@ class vDFRead(vDFUtils):
                 Get tail of the :py:class:`vDataFrame`.
         """
         exclude_columns = format_type(exclude_columns, dtype=list)
-        exclude_columns_ = [
+        exclude_columns_ = {
             c.replace('"', "").lower()
-            for c in exclude_columns + self._vars["exclude_columns"]
-        ]
+            for c in [*exclude_columns, *self._vars["exclude_columns"]]
+        }
         res = []
         for column in self._vars["columns"]:
             if column.replace('"', "").lower() not in exclude_columns_:
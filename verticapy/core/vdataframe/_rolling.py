@@ -366,13 +366,11 @@ class vDFRolling(vDFCorr):
         expr = expr.replace("#", windows_frame)
         self.eval(name=name, expr=expr)
         if func in ("kurtosis", "skewness", "jb"):
-            self._vars["exclude_columns"] += [
-                quote_ident(mean_name),
-                quote_ident(std_name),
-                quote_ident(count_name),
-            ]
+            self._vars["exclude_columns"].update(
+                quote_ident([mean_name, std_name, count_name])
+            )
         elif func == "aad":
-            self._vars["exclude_columns"] += [quote_ident(mean_name)]
+            self._vars["exclude_columns"].add(quote_ident(mean_name))
         return self
 
     @save_verticapy_logs
@@ -79,6 +79,27 @@ class vDFSystem(vDFTyping):
         str
             The SQL final relation.
         """
+        # The default relation is memoized with the state it
+        # was generated from. The transformations are tuples
+        # stored in lists, comparing them is enough to know if
+        # any vDataColumn, filter or sort changed.
+        state = None
+        if not (split or transformations or force_columns):
+            state = (
+                self._vars["main_relation"],
+                self._vars["allcols_ind"],
+                tuple(self._vars["columns"]),
+                tuple(
+                    tuple(getattr(self, column)._transf)
+                    for column in self._vars["columns"]
+                ),
+                tuple(self._vars["where"]),
+                tuple(self._vars["order_by"].items()),
+                frozenset(self._vars["exclude_columns"]),
+            )
+            gen_sql = self._vars.get("gen_sql")
+            if gen_sql and gen_sql[0] == state:
+                return gen_sql[1]
         # The First step is to find the Max Floor
         all_imputations_grammar = []
         transformations = format_type(transformations, dtype=dict)
@@ -136,9 +157,21 @@ class vDFSystem(vDFTyping):
                 FROM {self._vars['main_relation']}"""
         else:
             table = f"""SELECT * FROM {self._vars["main_relation"]}"""
-        # We compute the other floors
+        # We compute the other floors. A floor where all the
+        # vDataColumns keep their previous expression and which
+        # has no filter or sort is skipped once the columns are
+        # explicitly selected.
+        is_projected = not table.startswith("SELECT * ")
         for i in range(1, max_transformation_floor):
             values = [item[i] for item in all_imputations_grammar]
+            if (
+                is_projected
+                and all(value == "{}" for value in values)
+                and not (len(all_where) > i - 1 and all_where[i - 1])
+                and (i - 1) not in self._vars["order_by"]
+            ):
+                continue
+            is_projected = True
             for j in range(0, len(values)):
                 if values[j] == "{}":
                     values[j] = columns[j]
@@ -186,7 +219,10 @@ class vDFSystem(vDFTyping):
                 FROM {table}) VERTICAPY_SUBTABLE"""
         main_relation = self._vars["main_relation"]
         all_main_relation = f"(SELECT * FROM {main_relation}) VERTICAPY_SUBTABLE"
-        return table.replace(all_main_relation, main_relation)
+        table = table.replace(all_main_relation, main_relation)
+        if state is not None:
+            self._vars["gen_sql"] = (state, table)
+        return table
 
     def _get_catalog_value(
         self,
@@ -313,8 +349,9 @@ class vDFSystem(vDFTyping):
         if erase:
             if not columns:
                 columns = self.get_columns()
+            # The columns are the vDataColumns aliases.
             for column in columns:
-                self[column]._catalog = copy.deepcopy(agg_dict)
+                getattr(self, column)._catalog = {key: {} for key in agg_dict}
             self._vars["count"] = -1
         elif matrix:
             matrix = verticapy_agg_name(matrix.lower())
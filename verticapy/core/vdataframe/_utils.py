@@ -169,15 +169,19 @@ class vDFUtils(PlottingUtils):
                 return None
             if not columns or isinstance(columns, (int, float)):
                 return copy.deepcopy(columns)
+            # Names which are already formatted are returned as
+            # they are, only the other ones are matched against
+            # all the vDataFrame columns.
+            all_columns = self.get_columns()
+            formatted_columns = set(all_columns)
             if raise_error:
                 if isinstance(columns, str):
                     cols_to_check = [columns]
                 else:
                     cols_to_check = copy.deepcopy(columns)
-                all_columns = self.get_columns()
                 for column in cols_to_check:
                     result = []
-                    if column not in all_columns:
+                    if column not in formatted_columns:
                         min_distance, min_distance_op = 1000, ""
                         is_error = True
                         for col in all_columns:
@@ -198,20 +202,26 @@ class vDFUtils(PlottingUtils):
 
             if isinstance(columns, str):
                 result = columns
-                vdf_columns = self.get_columns()
-                for col in vdf_columns:
-                    if quote_ident(columns).lower() == quote_ident(col).lower():
-                        result = col
-                        break
+                if columns not in formatted_columns:
+                    for col in all_columns:
+                        if quote_ident(columns).lower() == quote_ident(col).lower():
+                            result = col
+                            break
             elif isinstance(columns, dict):
                 result = {}
                 for col in columns:
-                    key = self.format_colnames(col, raise_error=raise_error)
+                    if col in formatted_columns:
+                        key = col
+                    else:
+                        key = self.format_colnames(col, raise_error=raise_error)
                     result[key] = columns[col]
             else:
                 result = []
                 for col in columns:
-                    result += [self.format_colnames(col, raise_error=raise_error)]
+                    if isinstance(col, str) and col in formatted_columns:
+                        result += [col]
+                    else:
+                        result += [self.format_colnames(col, raise_error=raise_error)]
         if raise_error:
             expected_nb_of_cols = format_type(expected_nb_of_cols, dtype=list)
             if len(expected_nb_of_cols) > 0:
@@ -555,11 +555,14 @@ class vDataFrame(vDFAnimatedPlot):
         sql_push_ext: bool = True,
         _empty: bool = False,
         _is_sql_magic: int = 0,
+        _dtypes: Optional[list] = None,
     ) -> None:
         self._vars = {
             "allcols_ind": -1,
+            "apply_ctypes": {},
             "count": -1,
-            "exclude_columns": [],
+            "exclude_columns": set(),
+            "gen_sql": None,
             "history": [],
             "isflex": False,
             "max_columns": -1,
@@ -569,6 +572,7 @@ class vDataFrame(vDFAnimatedPlot):
             "sql_push_ext": external and sql_push_ext,
             "sql_magic_result": _is_sql_magic,
             "symbol": symbol,
+            "tmp_seq": 0,
             "where": [],
             "has_dpnames": False,
         }
@@ -626,7 +630,9 @@ class vDataFrame(vDFAnimatedPlot):
 
                 # Getting the main relation information
                 main_relation = f"({sql}) VERTICAPY_SUBTABLE"
-                dtypes = get_data_types(sql)
+                # The data types can be given when they are
+                # already known by the caller.
+                dtypes = _dtypes if _dtypes else get_data_types(sql)
                 isflex = False
 
             else:
@@ -14,13 +14,11 @@ OR CONDITIONS OF ANY KIND, either express or implied.
 See the  License for the specific  language governing
 permissions and limitations under the License.
 """
-import copy
 import html
 import re
 import math
 import textwrap
 from typing import Literal, Optional, Union
-import numpy as np
 
 import verticapy._config.config as conf
 from verticapy._typing import NoneType
@@ -29,6 +27,14 @@ if conf.get_import_success("graphviz"):
     import graphviz
     from graphviz import Source
 
+# Characters used to draw the Query Plan tree.
+_PREFIX_CHARS = "+- |>"
+
+# Patterns used to parse the Query Plan rows.
+_NON_DIGIT = re.compile(r"[^0-9]")
+_PATH_ID_RE = re.compile(r"PATH ID: ([^)]*)")
+_LINE_PREFIX_RE = re.compile(r"(?m)^[+\- |>]+")
+
 
 class PerformanceTree:
     """
@@ -105,25 +111,45 @@ class PerformanceTree:
         path_id_info: Optional[list] = None,
         style: dict = {},
     ) -> None:
+        # The rows, their path IDs and their levels are
+        # all parsed from the header lines in one pass.
         qplan = rows.split("\n")
-        n = len(qplan)
-        self.rows, tmp_rows = [], []
-        for i in range(n):
-            if "PATH ID: " in qplan[i] and i > 0:
-                self.rows += ["\n".join(tmp_rows)]
-                tmp_rows = []
-            tmp_rows += [qplan[i]]
+        self.rows, self.path_order, self._levels = [], [], []
+        tmp_rows = []
+        for i, line in enumerate(qplan):
+            if i == 0 or "PATH ID: " in line:
+                if tmp_rows:
+                    self.rows += ["\n".join(tmp_rows)]
+                    tmp_rows = []
+                self.path_order += [self._get_label(line)]
+                self._levels += [self._get_level(line)]
+            tmp_rows += [line]
         self.rows += ["\n".join(tmp_rows)]
-        self.path_order = [self._get_label(row) for row in self.rows]
         if len(self.path_order) == 0:
             raise ValueError(
                 "No PATH ID detected in the Query Plan.\n"
                 "It seems to be empty.\nAre you sured to have "
                 "profiled your query?"
             )
+        # Position of each path ID in the Query Plan.
+        self._path_index = {tree_id: i for i, tree_id in enumerate(self.path_order)}
+        # The level initiators are computed once. The
+        # relationships are generated when needed and
+        # then reused.
+        self._level_initiators = {}
+        for level, tree_id in zip(self._levels, self.path_order):
+            if level + 1 not in self._level_initiators:
+                self._level_initiators[level + 1] = [self.path_order[0]]
+            self._level_initiators[level + 1] += [tree_id]
+        self._relationships = None
+        self._formatted_rows = [
+            self._format_row(row.replace('"', "'")) for row in self.rows
+        ]
+        self._all_metrics = {}
+        self._links = {}
         if isinstance(path_id, NoneType):
             path_id = self.path_order[0]
-        if isinstance(path_id, int) and path_id in self.path_order:
+        if isinstance(path_id, int) and path_id in self._path_index:
             self.path_id = path_id
         else:
             raise ValueError(
@@ -140,7 +166,7 @@ class PerformanceTree:
                 f"Found {metric}."
             )
         self.show_ancestors = show_ancestors
-        d = copy.deepcopy(style)
+        d = dict(style)
         for color in ("color_low", "color_high"):
             if color not in d:
                 if color == "color_low":
@@ -177,7 +203,7 @@ class PerformanceTree:
             path_id_info = [path_id_info]
         if isinstance(path_id_info, list):
             for i in path_id_info:
-                if i not in self.path_order:
+                if i not in self._path_index:
                     raise ValueError(
                         "Wrong value for parameter 'path_id_info':\n"
                         f"It has to be integers in [{', '.join([str(p) for p in self.path_order])}].\n"
@@ -251,15 +277,12 @@ class PerformanceTree:
         # Ensure intensity is between 0 and 1
         intensity = max(0, min(1, intensity))
 
-        # Computing the color
-        colors = np.array(self.style["color_high"]) * intensity + np.array(
-            self.style["color_low"]
-        ) * (1 - intensity)
-
         # Calculate RGB values based on intensity
-        red = int(colors[0])
-        green = int(colors[1])
-        blue = int(colors[2])
+        high, low = self.style["color_high"], self.style["color_low"]
+        complement = 1 - intensity
+        red = int(high[0] * intensity + low[0] * complement)
+        green = int(high[1] * intensity + low[1] * complement)
+        blue = int(high[2] * intensity + low[2] * complement)
 
         # Format the color string
         color = f"#{red:02X}{green:02X}{blue:02X}"
@@ -318,14 +341,7 @@ class PerformanceTree:
         See :py:meth:`verticapy.performance.vertica.tree`
         for more information.
         """
-        rows = row.split("\n")
-        n = len(rows)
-        for i in range(n):
-            x = rows[i]
-            while len(x) > 0 and x[0] in ("+", "-", " ", "|", ">"):
-                x = x[1:]
-            rows[i] = x
-        return ("\n".join(rows)).replace("\n", "\n\n")
+        return _LINE_PREFIX_RE.sub("", row).replace("\n", "\n\n")
 
     @staticmethod
     def _format_number(nb: int) -> str:
@@ -384,12 +400,10 @@ class PerformanceTree:
         See :py:meth:`verticapy.performance.vertica.tree`
         for more information.
         """
-        res = row
-        while len(res) > 0 and res[0] in ("+", "-", " ", "|", ">"):
-            res = res[1:]
+        res = row.lstrip(_PREFIX_CHARS)
         if return_path_id:
-            res = res.split("PATH ID: ")[1].split(")")[0]
-            res = re.sub(r"[^0-9]", "", res)
+            match = _PATH_ID_RE.search(res)
+            res = _NON_DIGIT.sub("", match.group(1)) if match else ""
             if len(res) == 0:
                 return -1
             return int(res)
@@ -416,12 +430,8 @@ class PerformanceTree:
         See :py:meth:`verticapy.performance.vertica.tree`
         for more information.
         """
-        res = ""
-        i, n = 0, len(row)
-        while i < n and row[i] in ("+", "-", " ", "|", ">"):
-            res += row[i]
-            i += 1
-        return res.count("|")
+        prefix_len = len(row) - len(row.lstrip(_PREFIX_CHARS))
+        return row.count("|", 0, prefix_len)
 
     def _get_metric(self, row: str) -> int:
         """
@@ -452,11 +462,36 @@ class PerformanceTree:
         if res[-1] in ("]",):
             res = res[:-1]
         unit = self._map_unit(res[-1])
-        res = int(re.sub(r"[^0-9]", "", res))
+        res = int(_NON_DIGIT.sub("", res))
         if isinstance(unit, NoneType):
             return res
         return res * unit
 
+    def _get_all_metrics(self) -> list[float]:
+        """
+        Gets the log-scaled
+        metric of all the rows.
+        They are computed once
+        per metric. Rows without
+        metric count as 0.
+
+        Returns
+        -------
+        list
+            all the metrics.
+
+        Examples
+        --------
+        See :py:meth:`verticapy.performance.vertica.tree`
+        for more information.
+        """
+        if self.metric not in self._all_metrics:
+            metrics = (self._get_metric(row) for row in self.rows)
+            self._all_metrics[self.metric] = [
+                math.log(1 + metric) if metric else 0.0 for metric in metrics
+            ]
+        return self._all_metrics[self.metric]
+
     def _get_all_level_initiator(self, level: int) -> list[int]:
         """
         Gets the all the possible
@@ -478,12 +513,9 @@ class PerformanceTree:
         See :py:meth:`verticapy.performance.vertica.tree`
         for more information.
         """
-        res = [self.path_order[0]]
-        for idx, row in enumerate(self.rows):
-            row_level = self._get_level(row)
-            if row_level + 1 == level:
-                res += [self.path_order[idx]]
-        return res
+        if level in self._level_initiators:
+            return self._level_initiators[level]
+        return [self.path_order[0]]
 
     @staticmethod
     def _get_last_initiator(level_initiators: list[int], tree_id: int) -> int:
@@ -544,22 +576,14 @@ class PerformanceTree:
         if node == self.path_order[0]:
             return [x[0] for x in relationships] + [x[1] for x in relationships]
 
-        descendants = []
-
-        # Recursive function to find descendants
-        def find_recursive(current_node: int) -> None:
-            nonlocal descendants
-            children = [
-                child for parent, child in relationships if parent == current_node
-            ]
-            descendants.extend(children)
-            for child in children:
-                find_recursive(child)
+        # Children of each node
+        children = {}
+        for parent, child in relationships:
+            if parent not in children:
+                children[parent] = []
+            children[parent] += [child]
 
-        # Start the recursive search from the specified node
-        find_recursive(node)
-
-        return descendants
+        return self._find_relatives(node, children)
 
     def _find_ancestors(self, node: int, relationships: list[tuple[int, int]]) -> list:
         """
@@ -590,24 +614,65 @@ class PerformanceTree:
         if node == self.path_order[0]:
             return []
 
-        ancestors = []
+        # Parents of each node
+        parents = {}
+        for parent, child in relationships:
+            if child not in parents:
+                parents[child] = []
+            parents[child] += [parent]
 
-        # Recursive function to find ancestors
-        def find_recursive(current_node: int) -> None:
-            if current_node == self.path_order[0]:
-                return
-            nonlocal ancestors
-            parents = [
-                parent for parent, child in relationships if child == current_node
-            ]
-            ancestors.extend(parents)
-            for parent in parents:
-                find_recursive(parent)
+        # The search stops at the root
+        return self._find_relatives(node, parents, stop=self.path_order[0])
 
-        # Start the recursive search from the specified node
-        find_recursive(node)
+    @staticmethod
+    def _find_relatives(node: int, adjacency: dict, stop: Optional[int] = None) -> list:
+        """
+        Walks the tree from a
+        specific node, in the
+        order of a recursive
+        depth-first search: the
+        direct relatives of a
+        node come before the
+        relatives of each of
+        them.
 
-        return ancestors
+        Parameters
+        ----------
+        node: int
+            Node ID.
+        adjacency: dict
+            ``dict`` mapping each
+            node to the ``list``
+            of its direct relatives.
+        stop: int, optional
+            Node whose relatives
+            are not visited.
+
+        Returns
+        -------
+        list
+            list of relatives.
+
+        Examples
+        --------
+        See :py:meth:`verticapy.performance.vertica.tree`
+        for more information.
+        """
+        relatives = adjacency.get(node, [])
+        res, visited = list(relatives), {node}
+        stack = [iter(relatives)]
+        while stack:
+            current_node = next(stack[-1], None)
+            if current_node is None:
+                stack.pop()
+            elif current_node != stop and current_node not in visited:
+                # A node is only expanded once, even if the
+                # relationships of a malformed plan loop.
+                visited.add(current_node)
+                relatives = adjacency.get(current_node, [])
+                res += relatives
+                stack += [iter(relatives)]
+        return res
 
     def _gen_relationships(self) -> list[tuple[int, int]]:
         """
@@ -625,15 +690,44 @@ class PerformanceTree:
         See :py:meth:`verticapy.performance.vertica.tree`
         for more information.
         """
-        n = len(self.rows)
-        relationships = []
-        for i in range(n):
-            level = self._get_level(self.rows[i])
-            tree_id = self.path_order[i]
-            level_initiators = self._get_all_level_initiator(level)
-            id_initiator = self._get_last_initiator(level_initiators, tree_id)
-            relationships += [(id_initiator, tree_id)]
-        return relationships
+        if self._relationships is None:
+            relationships = []
+            for level, tree_id in zip(self._levels, self.path_order):
+                level_initiators = self._get_all_level_initiator(level)
+                id_initiator = self._get_last_initiator(level_initiators, tree_id)
+                relationships += [(id_initiator, tree_id)]
+            self._relationships = relationships
+        return self._relationships
+
+    def _get_links(self) -> frozenset[int]:
+        """
+        Gets the nodes linked to
+        the selected path ID:
+        its descendants, itself
+        and its ancestors if they
+        are displayed. They are
+        computed once per path ID
+        and display setting.
+
+        Returns
+        -------
+        frozenset
+            linked nodes.
+
+        Examples
+        --------
+        See :py:meth:`verticapy.performance.vertica.tree`
+        for more information.
+        """
+        key = (self.path_id, self.show_ancestors)
+        if key not in self._links:
+            relationships = self._gen_relationships()
+            links = self._find_descendants(self.path_id, relationships)
+            links += [self.path_id]
+            if self.show_ancestors:
+                links += self._find_ancestors(self.path_id, relationships)
+            self._links[key] = frozenset(links)
+        return self._links[key]
 
     def _gen_labels(self) -> str:
         """
@@ -650,42 +744,54 @@ class PerformanceTree:
         See :py:meth:`verticapy.performance.vertica.tree`
         for more information.
         """
-        n, res = len(self.rows), ""
+        n, res = len(self.rows), []
         if not (isinstance(self.metric, NoneType)):
-            all_metrics = [
-                math.log(1 + self._get_metric(self.rows[i])) for i in range(n)
-            ]
+            all_metrics = self._get_all_metrics()
             m_min, m_max = min(all_metrics), max(all_metrics)
-        relationships = self._gen_relationships()
-        links = self._find_descendants(self.path_id, relationships) + [self.path_id]
-        if self.show_ancestors:
-            links += self._find_ancestors(self.path_id, relationships)
+        links, path_id_info = self._get_links(), set(self.path_id_info)
+        dummy_id = self.path_order[-1] + 1
+        init_id = self.path_order[0]
+        info_color = self.style["info_color"]
+        info_fontcolor = self.style["info_fontcolor"]
+        info_fontsize = self.style["info_fontsize"]
+        info_rowsize = self.style["info_rowsize"]
+        # HTML content of the drawn tooltip nodes.
+        info_labels = {
+            tree_id: html.escape(textwrap.fill(row, width=info_rowsize)).replace(
+                "\n", "<br/>"
+            )
+            for tree_id, row in zip(self.path_order, self._formatted_rows)
+            if tree_id in path_id_info and tree_id in links
+        }
         for i in range(n):
             tree_id = self.path_order[i]
-            dummy_id = self.path_order[-1] + 1
-            init_id = self.path_order[0]
-            info_bubble = self.path_order[-1] + 1 + tree_id
+            info_bubble = dummy_id + tree_id
+            # The selected path ID is part of the links, so
+            # the colors are only computed for the drawn nodes.
+            if tree_id not in links:
+                continue
             if not (isinstance(self.metric, NoneType)):
-                alpha = (all_metrics[i] - m_min) / (m_max - m_min)
+                if m_max == m_min:
+                    alpha = 0.0
+                else:
+                    alpha = (all_metrics[i] - m_min) / (m_max - m_min)
                 color = self._generate_gradient_color(alpha)
             else:
                 color = self.style["fillcolor"]
-            label = self._get_label(self.rows[i])
-            if tree_id in links:
-                row = self._format_row(self.rows[i].replace('"', "'"))
-                res += f'\t{tree_id} [label="{label}", style="filled", fillcolor="{color}", tooltip="{row}", fixedsize=true, URL="#path_id={tree_id}"];\n'
-                if tree_id in self.path_id_info:
-                    info_color = self.style["info_color"]
-                    info_fontcolor = self.style["info_fontcolor"]
-                    info_fontsize = self.style["info_fontsize"]
-                    info_rowsize = self.style["info_rowsize"]
-                    html_content = textwrap.fill(row, width=info_rowsize)
-                    html_content = html.escape(html_content).replace("\n", "<br/>")
-                    res += f'\t{info_bubble} [shape=plaintext, fontcolor="{info_fontcolor}", style="filled", fillcolor="{info_color}", width=0.4, height=0.6, fontsize={info_fontsize}, label=<{html_content}>, URL="#path_id={tree_id}"];\n'
+            row = self._formatted_rows[i]
+            res += [
+                f'\t{tree_id} [label="{tree_id}", style="filled", fillcolor="{color}", tooltip="{row}", fixedsize=true, URL="#path_id={tree_id}"];\n'
+            ]
+            if tree_id in info_labels:
+                res += [
+                    f'\t{info_bubble} [shape=plaintext, fontcolor="{info_fontcolor}", style="filled", fillcolor="{info_color}", width=0.4, height=0.6, fontsize={info_fontsize}, label=<{info_labels[tree_id]}>, URL="#path_id={tree_id}"];\n'
+                ]
             if tree_id == self.path_id and tree_id != init_id and self.show_ancestors:
-                row = self._format_row(self.rows[self.path_id].replace('"', "'"))
-                res += f'\t{dummy_id} [label="{tree_id}", style="filled", fillcolor="{color}", tooltip="{row}", URL="#path_id={tree_id}"];\n'
-        return res
+                row = self._formatted_rows[self._path_index[self.path_id]]
+                res += [
+                    f'\t{dummy_id} [label="{tree_id}", style="filled", fillcolor="{color}", tooltip="{row}", URL="#path_id={tree_id}"];\n'
+                ]
+        return "".join(res)
 
     def _gen_links(self) -> str:
         """
@@ -702,27 +808,25 @@ class PerformanceTree:
         See :py:meth:`verticapy.performance.vertica.tree`
         for more information.
         """
-        res, n = "", len(self.rows)
+        res = []
         relationships = self._gen_relationships()
-        links = self._find_descendants(self.path_id, relationships)
+        links, path_id_info = self._get_links(), set(self.path_id_info)
         info_color = self.style["info_color"]
-        if self.show_ancestors:
-            links += self._find_ancestors(self.path_id, relationships)
-        for i in range(n):
-            tree_id = self.path_order[i]
-            dummy_id = self.path_order[-1] + 1
-            init_id = self.path_order[0]
-            info_bubble = self.path_order[-1] + 1 + tree_id
-            parent, child = relationships[i]
-            if parent != child and child in links:
-                res += f"\t{parent} -> {child} [dir=back];\n"
+        dummy_id = self.path_order[-1] + 1
+        init_id = self.path_order[0]
+        for tree_id, (parent, child) in zip(self.path_order, relationships):
+            info_bubble = dummy_id + tree_id
+            # The edge to the selected path ID, if any, is
+            # drawn to its dummy node.
+            if parent != child and child != self.path_id and child in links:
+                res += [f"\t{parent} -> {child} [dir=back];\n"]
             if child == self.path_id and tree_id != init_id and self.show_ancestors:
-                res += f"\t{parent} -> {dummy_id} [dir=back];\n"
-            if tree_id in self.path_id_info:
-                res += (
+                res += [f"\t{parent} -> {dummy_id} [dir=back];\n"]
+            if tree_id in path_id_info:
+                res += [
                     f'\t{info_bubble} -> {tree_id} [dir=none, color="{info_color}"];\n'
-                )
-        return res
+                ]
+        return "".join(res)
 
     def _gen_legend(self) -> str:
         """
@@ -739,28 +843,22 @@ class PerformanceTree:
         See :py:meth:`verticapy.performance.vertica.tree`
         for more information.
         """
-        n = len(self.rows)
-        all_metrics = [math.log(1 + self._get_metric(self.rows[i])) for i in range(n)]
+        all_metrics = self._get_all_metrics()
         m_min, m_max = min(all_metrics), max(all_metrics)
         cats = [0.0, 0.25, 0.5, 0.75, 1.0]
         cats = [
             self._format_number(int(math.exp(x * (m_max - m_min) + m_min) - 1))
             for x in cats
         ]
-        alpha0 = self._generate_gradient_color(0.0)
-        alpha025 = self._generate_gradient_color(0.25)
-        alpha050 = self._generate_gradient_color(0.5)
-        alpha075 = self._generate_gradient_color(0.75)
-        alpha1 = self._generate_gradient_color(1.0)
-        res = '\tlegend [shape=plaintext, fillcolor=white, label=<<table border="0" cellborder="1" cellspacing="0">'
-        res += f'<tr><td bgcolor="#DFDFDF">Legend</td></tr>'
-        res += f'<tr><td bgcolor="{alpha0}">{cats[0]}</td></tr>'
-        res += f'<tr><td bgcolor="{alpha025}">{cats[1]}</td></tr>'
-        res += f'<tr><td bgcolor="{alpha050}">{cats[2]}</td></tr>'
-        res += f'<tr><td bgcolor="{alpha075}">{cats[3]}</td></tr>'
-        res += f'<tr><td bgcolor="{alpha1}">{cats[4]}</td></tr>'
-        res += "</table>>]\n\n"
-        return res
+        res = [
+            '\tlegend [shape=plaintext, fillcolor=white, label=<<table border="0" cellborder="1" cellspacing="0">',
+            '<tr><td bgcolor="#DFDFDF">Legend</td></tr>',
+        ]
+        for alpha, cat in zip((0.0, 0.25, 0.5, 0.75, 1.0), cats):
+            color = self._generate_gradient_color(alpha)
+            res += [f'<tr><td bgcolor="{color}">{cat}</td></tr>']
+        res += ["</table>>]\n\n"]
+        return "".join(res)
 
     def to_graphviz(self) -> str:
         """
@@ -784,17 +882,18 @@ class PerformanceTree:
         height = self.style["height"]
         edge_color = self.style["edge_color"]
         edge_style = self.style["edge_style"]
-        res = "digraph Tree {\n"
-        res += f'\tnode [shape={shape}, style=filled, fillcolor="{fillcolor}", fontcolor="{fontcolor}", width={width}, height={height}];\n'
-        res += f'\tedge [color="{edge_color}", style={edge_style}];\n'
-        if not (isinstance(self.metric, NoneType)):
-            res += self._gen_legend()
+        res = [
+            "digraph Tree {\n",
+            f'\tnode [shape={shape}, style=filled, fillcolor="{fillcolor}", fontcolor="{fontcolor}", width={width}, height={height}];\n',
+            f'\tedge [color="{edge_color}", style={edge_style}];\n',
+        ]
+        # A single node does not need any legend.
+        if not (isinstance(self.metric, NoneType)) and len(self.rows) > 1:
+            res += [self._gen_legend()]
         else:
-            res += "\n"
-        res += self._gen_labels() + "\n"
-        res += self._gen_links() + "\n"
-        res += "}"
-        return res
+            res += ["\n"]
+        res += [self._gen_labels(), "\n", self._gen_links(), "\n", "}"]
+        return "".join(res)
 
     def plot_tree(
         self,
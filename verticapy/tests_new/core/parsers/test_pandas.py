@@ -0,0 +1,49 @@
+"""
+Copyright  (c)  2018-2024 Open Text  or  one  of its
+affiliates.  Licensed  under  the   Apache  License,
+Version 2.0 (the  "License"); You  may  not use this
+file except in compliance with the License.
+
+You may obtain a copy of the License at:
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless  required  by applicable  law or  agreed to in
+writing, software  distributed  under the  License is
+distributed on an  "AS IS" BASIS,  WITHOUT WARRANTIES
+OR CONDITIONS OF ANY KIND, either express or implied.
+See the  License for the specific  language governing
+permissions and limitations under the License.
+"""
+import pytest
+from verticapy import read_csv_arrow
+
+
+class TestPandas:
+    """
+    test class for Pandas parsers
+    """
+
+    @pytest.mark.parametrize(
+        "sep, input_sep",
+        [(",", None), (";", None), ("|", None), (";", ";")],
+    )
+    def test_read_csv_arrow(self, tmp_path, sep, input_sep):
+        """
+        test function - read_csv_arrow header and separator detection
+        """
+        path = tmp_path / "test_read_csv_arrow.csv"
+        path.write_text(
+            sep.join(["id", "name", "score"])
+            + "\n"
+            + sep.join(["1", "Alice", "2.5"])
+            + "\n"
+            + sep.join(["2", "Bob", "4.0"])
+            + "\n",
+            encoding="utf-8",
+        )
+        vdf = read_csv_arrow(str(path), sep=input_sep, temp_path=str(tmp_path))
+
+        assert vdf.get_columns() == ['"id"', '"name"', '"score"']
+        assert vdf.shape() == (2, 3)
+        assert vdf["name"].distinct() == ["Alice", "Bob"]
+        assert vdf["score"].sum() == pytest.approx(6.5)
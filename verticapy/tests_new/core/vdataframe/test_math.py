@@ -113,6 +113,31 @@ class TestMath:
 
         assert vpy_res == pytest.approx(py_res)
 
+    @pytest.mark.parametrize(
+        "func, scalars",
+        [
+            ("mul", {"age": 2, "fare": 3}),
+            ("round", {"age": 4, "fare": 2}),
+            ("sub", {"age": 2, "fare": 1.5}),
+        ],
+    )
+    def test_vdf_binary_operator(self, titanic_vd_fun, func, scalars):
+        """
+        test function - vDataFrame mul, round and sub
+        """
+        titanic_pdf = titanic_vd_fun.to_pandas()
+        getattr(titanic_vd_fun, func)(scalars)
+
+        for column, scalar in scalars.items():
+            vpy_res = titanic_vd_fun[column].sum()
+            py_res = getattr(titanic_pdf[column].astype(float), func)(scalar).sum()
+
+            print(
+                f"Function Name: {func} \ncolumn: {column} \nVerticaPy Result: {vpy_res} \nPython Result :{py_res}\n"
+            )
+
+            assert vpy_res == pytest.approx(py_res, rel=1e-04)
+
     @pytest.mark.parametrize(
         "columns, input_type, func, copy_name",
         [
@@ -177,6 +202,44 @@ class TestMath:
         print(f"VerticaPy Result: {vpy_res} \nPython Result :{py_res}\n")
         assert vpy_res == pytest.approx(py_res)
 
+    @pytest.mark.parametrize(
+        "step, fused",
+        [(None, True), ("filter", False), ("sort", False), ("deeper", False)],
+    )
+    def test_apply_fusion(self, titanic_vd_fun, step, fused):
+        """
+        test function - apply fusion of the chained transformations
+        """
+        titanic_pdf = titanic_vd_fun.to_pandas()
+        titanic_pdf["age"] = titanic_pdf["age"].astype(float)
+
+        if step == "deeper":
+            titanic_vd_fun["fare"].apply("AVG({}) OVER ()")
+            titanic_vd_fun["fare"].apply("{} - 1")
+            assert len(titanic_vd_fun["fare"]._transf) == 3
+        titanic_vd_fun["age"].apply("ABS({})")
+        if step == "filter":
+            titanic_vd_fun.filter("age > 10")
+            titanic_pdf = titanic_pdf[titanic_pdf["age"].abs() > 10]
+        elif step == "sort":
+            titanic_vd_fun.sort({"age": "asc"})
+        titanic_vd_fun["age"].apply("{} + 1")
+
+        relation = titanic_vd_fun.current_relation(reindent=False)
+        if fused:
+            assert len(titanic_vd_fun["age"]._transf) == 2
+            assert '(ABS("age")) + 1 AS "age"' in relation
+        else:
+            assert len(titanic_vd_fun["age"]._transf) == 3
+            assert 'ABS("age") AS "age"' in relation
+            assert '"age" + 1 AS "age"' in relation
+
+        vpy_res = titanic_vd_fun["age"].sum()
+        py_res = (titanic_pdf["age"].abs() + 1).sum()
+
+        print(f"VerticaPy Result: {vpy_res} \nPython Result :{py_res}\n")
+        assert vpy_res == pytest.approx(py_res)
+
     @pytest.mark.parametrize(
         "columns, data, vpy_func, py_func",
         [
@@ -198,6 +261,8 @@ class TestMath:
             ("age", None, "floor", "np.floor(x)"),
             ("album_cost", "sample_data", "len", "np.size(x)"),
             ("album_cost", "sample_data", "length", "np.size(x)"),
+            ("name", None, "len", "len(x)"),
+            ("name", None, "length", "len(x)"),
             ("age", None, "ln", "np.log(x)"),
             (
                 "age",
@@ -872,6 +937,23 @@ class TestMath:
             py_res[0] if func == "quantile" else py_res, rel=_rel_tol, abs=_abs_tol
         )
 
+    @pytest.mark.parametrize("func", ["skewness", "kurtosis", "jb"])
+    @pytest.mark.parametrize("offset", [1e5, 1.7e9])
+    def test_analytic_moments_offset(self, titanic_vd_fun, func, offset):
+        """
+        test function - analytic moments of a column with a large mean
+        """
+        titanic_vd_fun.eval("fare_offset", f"fare + {offset}")
+        titanic_vd_fun.analytic(func=func, columns="fare", name="raw_res")
+        titanic_vd_fun.analytic(func=func, columns="fare_offset", name="offset_res")
+        vpy_res = titanic_vd_fun["offset_res"][0]
+        py_res = titanic_vd_fun["raw_res"][0]
+
+        print(
+            f"Function name: {func} \noffset: {offset} \nVerticaPy Result: {vpy_res} \nExpected Result :{py_res}\n"
+        )
+        assert vpy_res == pytest.approx(py_res, rel=1e-03)
+
     @pytest.mark.parametrize("column, func", [("sex", "DECODE({}, NULL, 0, 1)")])
     def test_applymap(self, titanic_vd_fun, column, func):
         """
@@ -0,0 +1,88 @@
+"""
+Copyright  (c)  2018-2024 Open Text  or  one  of its
+affiliates.  Licensed  under  the   Apache  License,
+Version 2.0 (the  "License"); You  may  not use this
+file except in compliance with the License.
+
+You may obtain a copy of the License at:
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless  required  by applicable  law or  agreed to in
+writing, software  distributed  under the  License is
+distributed on an  "AS IS" BASIS,  WITHOUT WARRANTIES
+OR CONDITIONS OF ANY KIND, either express or implied.
+See the  License for the specific  language governing
+permissions and limitations under the License.
+"""
+import pytest
+from verticapy import vDataFrame
+
+
+class TestSys:
+    """
+    test class for System functions test
+    """
+
+    @pytest.mark.parametrize(
+        "step, floors, expected",
+        [
+            (None, ["{}", "{}"], 2),
+            ("filter", ["{}", "{}"], 3),
+            ("sort", ["{}", "{}"], 3),
+            (None, ["{}", "ABS({})"], 3),
+        ],
+    )
+    def test_gen_sql_identity_floors(self, titanic_vd_fun, step, floors, expected):
+        """
+        test function - _genSQL identity floors
+        """
+        titanic_vd_fun["age"].apply("ABS({})")
+        if step == "filter":
+            titanic_vd_fun.filter("age > 10")
+        elif step == "sort":
+            titanic_vd_fun.sort({"age": "asc"})
+
+        relation = titanic_vd_fun._genSQL(
+            transformations={'"age_copy"': ['"age"'] + floors}
+        )
+        assert relation.count("VERTICAPY_SUBTABLE") == expected
+        assert (
+            vDataFrame(f"SELECT * FROM {relation}").shape()[0]
+            == titanic_vd_fun.shape()[0]
+        )
+
+    @pytest.mark.parametrize("step", ["apply", "filter", "sort", "drop", "setitem"])
+    def test_current_relation(self, titanic_vd_fun, step):
+        """
+        test function - current_relation after a modification
+        """
+        relation = titanic_vd_fun.current_relation(reindent=False)
+        assert titanic_vd_fun.current_relation(reindent=False) == relation
+
+        if step == "apply":
+            titanic_vd_fun["age"].apply("ABS({})")
+        elif step == "filter":
+            titanic_vd_fun.filter("age > 10")
+        elif step == "sort":
+            titanic_vd_fun.sort({"age": "asc"})
+        elif step == "drop":
+            titanic_vd_fun["boat"].drop()
+        else:
+            titanic_vd_fun["fare_2"] = "fare * 2"
+
+        new_relation = titanic_vd_fun.current_relation(reindent=False)
+        assert new_relation != relation
+        assert titanic_vd_fun.current_relation(reindent=False) == new_relation
+
+    def test_current_relation_copy(self, titanic_vd_fun):
+        """
+        test function - current_relation of a copy
+        """
+        relation = titanic_vd_fun.current_relation(reindent=False)
+        titanic_vd_copy = titanic_vd_fun.copy()
+        assert titanic_vd_copy.current_relation(reindent=False) == relation
+
+        titanic_vd_copy["age"].apply("ABS({})")
+        assert titanic_vd_copy.current_relation(reindent=False) != relation
+        assert titanic_vd_fun.current_relation(reindent=False) == relation
+        assert titanic_vd_fun._vars["gen_sql"][1] == relation
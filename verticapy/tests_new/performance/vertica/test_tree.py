@@ -0,0 +1,80 @@
+"""
+Copyright  (c)  2018-2024 Open Text  or  one  of its
+affiliates.  Licensed  under  the   Apache  License,
+Version 2.0 (the  "License"); You  may  not use this
+file except in compliance with the License.
+
+You may obtain a copy of the License at:
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless  required  by applicable  law or  agreed to in
+writing, software  distributed  under the  License is
+distributed on an  "AS IS" BASIS,  WITHOUT WARRANTIES
+OR CONDITIONS OF ANY KIND, either express or implied.
+See the  License for the specific  language governing
+permissions and limitations under the License.
+"""
+import math
+
+import pytest
+
+from verticapy.performance.vertica.tree import PerformanceTree
+
+
+class TestPerformanceTree:
+    """
+    test class for PerformanceTree
+    """
+
+    def test_metric_none(self):
+        """
+        test function - rows without metric
+        """
+        rows = (
+            "+-SELECT [Cost: 1K, Rows: 10] (PATH ID: 1)\n"
+            "|  +---> GROUPBY (PATH ID: 2)\n"
+            "|  |      +---> STORAGE ACCESS [Cost: 5, Rows: 3K] (PATH ID: 3)"
+        )
+        tree = PerformanceTree(rows)
+        assert tree._get_all_metrics() == pytest.approx(
+            [math.log(11), 0.0, math.log(3001)]
+        )
+        assert '2 [label="2", style="filled", fillcolor="#00FF00"' in tree.to_graphviz()
+
+    @pytest.mark.parametrize(
+        "rows, legend",
+        [
+            ("+-SELECT [Cost: 1K, Rows: 10] (PATH ID: 1)", False),
+            (
+                "+-SELECT [Cost: 1K, Rows: 10] (PATH ID: 1)\n"
+                "|  +---> GROUPBY [Cost: 2K, Rows: 10] (PATH ID: 4)",
+                True,
+            ),
+        ],
+    )
+    def test_same_metric(self, rows, legend):
+        """
+        test function - plans where all the metrics are equal
+        """
+        res = PerformanceTree(rows).to_graphviz()
+        assert ("legend [" in res) == legend
+        assert '1 [label="1", style="filled", fillcolor="#00FF00"' in res
+        if legend:
+            assert '4 [label="4", style="filled", fillcolor="#00FF00"' in res
+
+    def test_path_id_not_contiguous(self):
+        """
+        test function - path IDs which are not contiguous
+        """
+        rows = (
+            "+-SELECT [Cost: 1K, Rows: 10] (PATH ID: 1)\n"
+            "|  +---> GROUPBY [Cost: 2K, Rows: 5] (PATH ID: 4)\n"
+            "|  |      +---> STORAGE ACCESS [Cost: 5, Rows: 3K] (PATH ID: 7)"
+        )
+        res = PerformanceTree(rows, path_id=4).to_graphviz()
+        assert (
+            '8 [label="4", style="filled", fillcolor="#00FF00", '
+            'tooltip="GROUPBY [Cost: 2K, Rows: 5] (PATH ID: 4)"'
+        ) in res
+        assert "1 -> 8 [dir=back];" in res
+        assert "4 -> 7 [dir=back];" in res